@@ -0,0 +1,56 @@
+'''Import-time budget of the local path, measured in fresh interpreters.
+
+    python bench/import_budget.py [--runs 5]
+
+Prints JSON with the median milliseconds per step and exits with 1 when a step is over its budget
+or when a local answer pulled in symai.
+'''
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# milliseconds, with headroom over the interpreter startup on a slow machine
+BUDGET = {'import': 60.0, 'local_answer': 100.0}
+
+_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+from src.core import TimezoneCore
+imported = time.perf_counter()
+TimezoneCore().forward('What is the 2PM CEST in Taiwan Time?')
+answered = time.perf_counter()
+print(json.dumps({'import': (imported - start) * 1000, 'local_answer': (answered - imported) * 1000,
+                  'symai': 'symai' in sys.modules}))
+'''
+
+
+def measure(runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _SCRIPT], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        samples.append(json.loads(output))
+    report = {step: round(statistics.median(sample[step] for sample in samples), 1) for step in BUDGET}
+    report['symai'] = any(sample['symai'] for sample in samples)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args   = parser.parse_args(argv)
+    report = measure(args.runs)
+    report['budget'] = BUDGET
+    report['ok']     = not report['symai'] and all(report[step] <= limit for step, limit in BUDGET.items())
+    print(json.dumps(report, indent=2))
+    return 0 if report['ok'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+'''Benchmark retrieval, prompt size and end-to-end latency against a stub engine.
+
+    python bench/run.py [--runs 20] [--stub-latency 0] [--output results.json]
+
+The corpus in ``bench/corpus.json`` maps places and abbreviations to the TZ identifiers retrieval should
+find, and lists requests for the end-to-end run. The model is replaced by a stub, so the numbers cover the
+package only; ``--stub-latency`` adds a fixed delay per model call. The report is JSON, so runs can be
+compared over time. Latencies are in milliseconds.
+'''
+import argparse
+import json
+import os
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.core import TimezoneCore                     # noqa: E402
+from src.gazetteer import place_index                 # noqa: E402
+from src.prompt import estimate_tokens                # noqa: E402
+from src.search import similarity, trigram_index      # noqa: E402
+from src.stats import PipelineStats                   # noqa: E402
+from src.zones import zone_index                      # noqa: E402
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus.json')
+K      = (1, 3, 5, 10)
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+
+    def at(fraction):
+        return round(samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000, 4)
+
+    return {'p50': at(0.5), 'p90': at(0.9), 'p99': at(0.99), 'max': round(samples[-1] * 1000, 4), 'n': len(samples)}
+
+
+def timed(call, *args):
+    start  = time.perf_counter()
+    result = call(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_retrieval(entries, runs):
+    index  = zone_index()
+    search = TimezoneCore(server='').retrieve
+    cold, warm, hits, misses = [], [], dict.fromkeys(K, 0), []
+    returned = 0
+    for entry in entries:
+        similarity.cache_clear()
+        results, seconds = timed(search, entry['query'], max(K))
+        cold.append(seconds)
+        for _ in range(runs):
+            warm.append(timed(search, entry['query'], max(K))[1])
+        names    = [index.name[row] for row, _ in results]
+        returned += len(names)
+        expected = set(entry['expected'])
+        for k in K:
+            hits[k] += bool(expected.intersection(names[:k]))
+        if not expected.intersection(names):
+            misses.append({'query': entry['query'], 'expected': entry['expected'], 'got': names[:3]})
+    return {'queries': len(entries), 'cold': percentiles(cold), 'warm': percentiles(warm),
+            'recall': {f'@{k}': round(hits[k] / len(entries), 4) for k in K},
+            'mean_rows': round(returned / len(entries), 2), 'misses': misses}
+
+
+class StubEngine:
+    '''Stands in for the symai ``Function``: records the prompts and answers after ``latency`` seconds.'''
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.prompts = []
+
+    def __call__(self, data, *args, **kwargs):
+        self.prompts.append(data)
+        if self.latency:
+            time.sleep(self.latency)
+        return 'stub answer'
+
+
+def bench_end_to_end(requests, runs, latency, local):
+    engine   = StubEngine(latency)
+    pipeline = TimezoneCore(local=local, stats=PipelineStats(), server='')
+    pipeline.fn = engine
+    static   = estimate_tokens(pipeline.prompt_builder.static())
+    seconds  = []
+    paths    = {}
+    for _ in range(runs):
+        for request in requests:
+            answer, elapsed = timed(pipeline.forward, request)
+            seconds.append(elapsed)
+            paths[answer.path] = paths.get(answer.path, 0) + 1
+    tokens = [static + estimate_tokens(prompt) for prompt in engine.prompts[:len(requests)]]
+    report = {'requests': len(requests), 'latency': percentiles(seconds), 'paths': paths, 'model_calls': len(engine.prompts),
+              'stage_mean': {stage: round(summary['mean'] * 1000, 4)
+                             for stage, summary in pipeline.stats.snapshot()['stages'].items()}}
+    if tokens:
+        report['prompt_tokens'] = {'static': static, 'mean': round(sum(tokens) / len(tokens), 1),
+                                   'max': max(tokens), 'total': sum(tokens)}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default=CORPUS)
+    parser.add_argument('--runs', type=int, default=20, help='warm repetitions per query')
+    parser.add_argument('--stub-latency', type=float, default=0.0, help='milliseconds per stub model call')
+    parser.add_argument('--output', default='-', help='report file, - for stdout')
+    args = parser.parse_args(argv)
+
+    with open(args.corpus, encoding='utf-8') as f:
+        corpus = json.load(f)
+    start  = time.perf_counter()
+    zone_index(), trigram_index(), place_index()
+    report = {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': sys.version.split()[0],
+        'build_ms': round((time.perf_counter() - start) * 1000, 2),
+        'retrieval': bench_retrieval(corpus['retrieval'], args.runs),
+        # the default pipeline, and every request through the stub to measure the prompts
+        'end_to_end': {
+            'local': bench_end_to_end(corpus['requests'], args.runs, args.stub_latency / 1000, local=True),
+            'model': bench_end_to_end(corpus['requests'], args.runs, args.stub_latency / 1000, local=False),
+        },
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
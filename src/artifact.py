@@ -0,0 +1,123 @@
+import json
+import mmap
+import os
+import struct
+import warnings
+from functools import lru_cache
+
+
+# environment variable naming the artifact file; set it empty to always use the embedded table
+ARTIFACT_ENV = 'TIMEZONE_ARTIFACT'
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zones.tzix')
+
+MAGIC   = b'TZIX'
+# 2: footer rules in the header
+FORMAT  = 2
+# magic, format, header length
+_PREFIX = struct.Struct('<4sIQ')
+
+
+def _align(size, to=8):
+    return -size % to
+
+
+def write_artifact(path, header, arrays):
+    '''Write a JSON header and NumPy arrays into one file that ``read_artifact`` maps without copying.
+
+    The file is written next to ``path`` and renamed into place, so processes that have the old
+    file mapped keep reading a consistent version.
+    '''
+    layout = {}
+    offset = 0
+    for name, values in arrays.items():
+        layout[name] = [values.dtype.str, offset, len(values)]
+        offset += values.nbytes + _align(values.nbytes)
+    encoded = json.dumps(dict(header, format=FORMAT, arrays=layout), ensure_ascii=False).encode('utf-8')
+    encoded += b' ' * _align(_PREFIX.size + len(encoded))
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT, len(encoded)))
+        f.write(encoded)
+        for values in arrays.values():
+            f.write(values.tobytes())
+            f.write(b'\0' * _align(values.nbytes))
+    os.replace(temporary, path)
+    return path
+
+
+class Artifact:
+    '''A compiled zone artifact mapped read-only into memory.
+
+    The header holds the zone rows (in the layout of the embedded tables), country names, aliases,
+    per-zone abbreviations and footer rules; ``zone_arrays`` returns transition arrays that are views into the mapping,
+    so worker processes share one copy through the page cache.
+    '''
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format, size = _PREFIX.unpack_from(self._buffer)
+        if magic != MAGIC or format != FORMAT:
+            raise ValueError(f'not a format {FORMAT} zone artifact')
+        self.path    = path
+        self.header  = json.loads(self._buffer[_PREFIX.size:_PREFIX.size + size])
+        self._data   = _PREFIX.size + size
+        self._zones  = {name: zone for zone, name in enumerate(self.header['zones'])}
+
+    @property
+    def version(self):
+        return self.header['tzdata']
+
+    @property
+    def rows(self):
+        return self.header['rows']
+
+    def array(self, name):
+        import numpy as np
+        dtype, offset, count = self.header['arrays'][name]
+        return np.frombuffer(self._buffer, dtype, count, self._data + offset)
+
+    def zone_arrays(self, name):
+        # (instants, offsets, isdst, abbr, abbrs) of a zone or link, None for unknown names
+        zone = self._zones.get(self.header['aliases'].get(name, name))
+        if zone is None:
+            return None
+        start, end = (int(bound) for bound in self.array('zone_start')[zone:zone + 2])
+        return (self.array('instants')[start:end], self.array('offsets')[start:end], self.array('isdst')[start:end],
+                self.array('abbr')[start:end], self.header['abbrs'][zone])
+
+    def zone_footer(self, name):
+        # the POSIX rule that continues a zone after ``until_year``, None for zones without DST
+        footers = self.header.get('footers')
+        zone    = self._zones.get(self.header['aliases'].get(name, name))
+        return footers[zone] if footers and zone is not None else None
+
+
+def system_tzdata_version():
+    # '2025b' from the first line of tzdata.zi, None without one
+    from .zones import tzdata_file
+    path = tzdata_file('tzdata.zi')
+    if path is None:
+        return None
+    with open(path, encoding='utf-8') as f:
+        line = f.readline()
+    return line.split()[-1] if line.startswith('# version') else None
+
+
+@lru_cache(maxsize=None)
+def artifact():
+    '''The compiled artifact, or None when it is missing, unreadable or built from other tzdata.'''
+    path = os.environ.get(ARTIFACT_ENV, DEFAULT_PATH)
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        loaded = Artifact(path)
+    except (OSError, ValueError) as error:
+        warnings.warn(f'ignoring zone artifact {path}: {error}')
+        return None
+    system = system_tzdata_version()
+    if system is not None and loaded.version != system:
+        warnings.warn(f'ignoring zone artifact {path}: built from tzdata {loaded.version}, the system has {system}; '
+                      f'rebuild it with python -m src.build')
+        return None
+    return loaded
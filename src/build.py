@@ -0,0 +1,143 @@
+'''Compile the system tzdata into the zone artifact read by ``src.artifact``.
+
+    python -m src.build [--tzdata /usr/share/zoneinfo] [-o src/zones.tzix] [--until-year 2100]
+
+Zones and links come from ``tzdata.zi``, countries and comments from ``zone1970.tab`` and ``zone.tab``,
+country names from ``iso3166.tab`` and the transitions from the compiled TZif files. STD/DST offsets and
+abbreviations are those in effect in the year of the build.
+'''
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from zoneinfo import TZPATH
+
+import numpy as np
+
+from .artifact import ARTIFACT_ENV, DEFAULT_PATH, write_artifact
+from .transitions import read_tzif
+from .zones import format_offset, read_country_names
+
+
+def tzdata_directory():
+    for path in TZPATH:
+        if os.path.isfile(os.path.join(path, 'tzdata.zi')):
+            return path
+    return None
+
+
+def read_zi(path):
+    # version, canonical zone names and {link: target} of a tzdata.zi file
+    version = None
+    zones   = []
+    links   = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('# version'):
+                version = line.split()[-1]
+            elif line.startswith('Z '):
+                zones.append(line.split()[1])
+            elif line.startswith('L '):
+                _, target, link = line.split()[:3]
+                links[link] = target
+    return version, zones, links
+
+
+def read_tab(path):
+    # {zone: (country codes, comment)} of zone1970.tab or zone.tab
+    zones = {}
+    if not os.path.isfile(path):
+        return zones
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            fields = line.rstrip('\n').split('\t')
+            zones[fields[2]] = (fields[0].split(','), fields[3] if len(fields) > 3 else '')
+    return zones
+
+
+def short_abbreviation(abbr):
+    # numeric designations as the embedded table writes them: '+0545' -> '545', '-01' -> '-1'
+    return str(int(abbr)) if abbr.lstrip('+-').isdigit() else abbr
+
+
+def offsets_in(transitions, year):
+    # (STD minutes, DST minutes, STD abbreviation) from mid-January and mid-July of ``year``
+    samples = np.array([datetime(year, month, 15, 12, tzinfo=timezone.utc).timestamp() for month in (1, 7)], np.int64)
+    interval = transitions.interval(samples)
+    offsets  = [int(offset) // 60 for offset in transitions.offsets[interval]]
+    isdst    = [bool(flag) for flag in transitions.isdst[interval]]
+    abbrs    = [transitions.abbrs[abbr] for abbr in transitions.abbr[interval]]
+    std      = isdst.index(False) if False in isdst else 0
+    dst      = isdst.index(True) if True in isdst else std
+    return offsets[std], offsets[dst], short_abbreviation(abbrs[std])
+
+
+def row_line(codes, name, comment, kind, std, dst, abbr):
+    # the tab-separated layout of the embedded tables, negative offsets with the unicode minus
+    return '\t'.join((', '.join(codes), name, comment, kind, format_offset(std).replace('-', '−'),
+                      format_offset(dst).replace('-', '−'), abbr))
+
+
+def build(directory=None, output=DEFAULT_PATH, until_year=2100, year=None):
+    directory = directory or tzdata_directory()
+    if directory is None:
+        raise FileNotFoundError('no tzdata directory with tzdata.zi on TZPATH')
+    year = year or datetime.now(timezone.utc).year
+    version, zones, links = read_zi(os.path.join(directory, 'tzdata.zi'))
+    zone1970 = read_tab(os.path.join(directory, 'zone1970.tab'))
+    zonetab  = read_tab(os.path.join(directory, 'zone.tab'))
+
+    transitions = {}
+    for name in zones:
+        with open(os.path.join(directory, name), 'rb') as f:
+            transitions[name] = read_tzif(name, f.read(), until_year)
+
+    rows = []
+    for name in zones + list(links):
+        target        = links.get(name, name)
+        # a link in neither tab file gets no countries: its target's list ('DE, DK, NO, SE, SJ' for
+        # Europe/Berlin) would file Atlantic/Jan_Mayen under Germany
+        codes, comment = zone1970.get(name) or zonetab.get(name) or ([], '')
+        kind          = 'Link' if name in links else 'Canonical'
+        rows.append((codes, name, comment, kind, *offsets_in(transitions[target], year)))
+    # zones without a country first, then by their first country code, as in the embedded tables;
+    # canonical zones lead within a country (Europe/Berlin before the Europe/Busingen link)
+    rows.sort(key=lambda row: (bool(row[0]), row[0][:1], row[3] != 'Canonical', ', '.join(row[0]), row[1]))
+
+    counts = np.array([len(zone) for zone in transitions.values()], np.int64)
+    header = {
+        'tzdata': version,
+        'year': year,
+        'until_year': until_year,
+        'rows': [row_line(*row) for row in rows],
+        'zones': list(transitions),
+        'aliases': links,
+        'abbrs': [zone.abbrs for zone in transitions.values()],
+        'footers': [zone.footer for zone in transitions.values()],
+        'country_names': read_country_names(os.path.join(directory, 'iso3166.tab')),
+    }
+    arrays = {
+        'zone_start': np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+        'instants': np.concatenate([zone.instants for zone in transitions.values()]).astype('<i8'),
+        'offsets': np.concatenate([zone.offsets for zone in transitions.values()]).astype('<i4'),
+        'isdst': np.concatenate([zone.isdst for zone in transitions.values()]).astype(np.int8),
+        'abbr': np.concatenate([zone.abbr for zone in transitions.values()]).astype('<i2'),
+    }
+    return write_artifact(output, header, arrays)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.build', description=__doc__.splitlines()[0])
+    parser.add_argument('--tzdata', help='directory with tzdata.zi and the TZif files, defaults to the first on TZPATH')
+    parser.add_argument('-o', '--output', default=os.environ.get(ARTIFACT_ENV) or DEFAULT_PATH)
+    parser.add_argument('--until-year', type=int, default=2100, help='last year of the POSIX rule transitions')
+    args = parser.parse_args(argv)
+    path = build(args.tzdata, args.output, args.until_year)
+    print(f'wrote {path} ({os.path.getsize(path)} bytes)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
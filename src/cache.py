@@ -0,0 +1,201 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+
+from .artifact import system_tzdata_version
+from .parser import normalize
+
+
+Entry = namedtuple('Entry', 'value path expires')
+
+
+def next_transition(zone, start: float, end: float):
+    # first second in (start, end] where the UTC offset of ``zone`` differs from the one at ``start``;
+    # offsets are probed daily and the change is narrowed down by bisection
+    def offset(seconds):
+        return datetime.fromtimestamp(seconds, timezone.utc).astimezone(zone).utcoffset()
+
+    low    = int(start)
+    end    = int(end)
+    before = offset(low)
+    while low < end:
+        high = min(low + 86400, end)
+        if offset(high) != before:
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset(middle) == before:
+                    low = middle
+                else:
+                    high = middle
+            return high
+        low = high
+    return None
+
+
+def cache_key(query, now: float, now_bucket: float):
+    # questions about the current time share an entry for ``now_bucket`` seconds; questions without
+    # a date are answered for today, so they are keyed on the UTC date
+    key = normalize(query)
+    if query.time is None:
+        return f'{key} @{int(now // now_bucket)}'
+    if query.date is None:
+        return f'{key} @{datetime.fromtimestamp(now, timezone.utc).date()}'
+    return key
+
+
+class ResponseCache:
+    '''Bounded LRU cache of answers with a TTL.
+
+    An entry also expires at the next UTC-offset change of the zones it involves,
+    so answers computed before a DST transition are not served after it.
+    '''
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0, now_bucket: float = 60.0, clock=time.time):
+        self.maxsize    = maxsize
+        self.ttl        = ttl
+        self.now_bucket = now_bucket
+        self.clock      = clock
+        self.hits       = 0
+        self.misses     = 0
+        self._entries   = OrderedDict()
+        self._lock      = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, query):
+        return cache_key(query, self.clock(), self.now_bucket)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, value, path: str, zones=()):
+        now     = self.clock()
+        expires = now + self.ttl
+        for zone in zones:
+            if getattr(zone, 'key', None):
+                expires = next_transition(zone, now, expires) or expires
+        with self._lock:
+            self._entries[key] = Entry(value, path, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+class SQLiteCache:
+    '''``ResponseCache`` in a SQLite file, shared by every process on the host.
+
+    Entries are keyed on the normalized request, ``settings`` (the model and its parameters, as a string)
+    and the tzdata version, so a new model or new tz rules never serve old answers. The database runs
+    in WAL mode, so readers do not block the writer, and waits up to ``timeout`` seconds for locks.
+    Every ``prune_every`` inserts, the least recently used entries beyond ``maxsize`` are evicted, so
+    the file holds at most ``prune_every`` entries per writing process more than ``maxsize``.
+    '''
+
+    def __init__(self, path: str, maxsize: int = 100000, ttl: float = 86400.0, now_bucket: float = 60.0,
+                 settings: str = '', timeout: float = 5.0, clock=time.time, prune_every: int = 64):
+        self.path        = os.path.expanduser(path)
+        self.maxsize     = maxsize
+        self.ttl         = ttl
+        self.now_bucket  = now_bucket
+        self.settings    = settings
+        self.timeout     = timeout
+        self.clock       = clock
+        # counting the rows scans the whole table, so it is not done on every insert
+        self.prune_every = max(1, prune_every)
+        self.tzdata      = system_tzdata_version() or ''
+        self.hits        = 0
+        self.misses      = 0
+        self._lock       = threading.Lock()
+        self._pid        = None
+        self._db         = None
+        self._inserts    = 0
+
+    def _connection(self):
+        # connections do not survive a fork, each process opens its own
+        if self._pid != os.getpid():
+            self._db  = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute('''CREATE TABLE IF NOT EXISTS answers (
+                key TEXT, settings TEXT, tzdata TEXT, value TEXT, path TEXT, expires REAL, accessed REAL,
+                PRIMARY KEY (key, settings, tzdata)) WITHOUT ROWID''')
+            self._db.execute('CREATE INDEX IF NOT EXISTS answers_accessed ON answers (accessed)')
+            self._pid = os.getpid()
+        return self._db
+
+    def __len__(self):
+        with self._lock:
+            return self._connection().execute('SELECT count(*) FROM answers').fetchone()[0]
+
+    def key(self, query):
+        return cache_key(query, self.clock(), self.now_bucket)
+
+    def get(self, key):
+        now = self.clock()
+        with self._lock:
+            db  = self._connection()
+            row = db.execute('SELECT value, path, expires FROM answers WHERE key = ? AND settings = ? AND tzdata = ?',
+                             (key, self.settings, self.tzdata)).fetchone()
+            if row is not None and row[2] <= now:
+                db.execute('DELETE FROM answers WHERE key = ? AND settings = ? AND tzdata = ?',
+                           (key, self.settings, self.tzdata))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute('UPDATE answers SET accessed = ? WHERE key = ? AND settings = ? AND tzdata = ?',
+                       (now, key, self.settings, self.tzdata))
+            self.hits += 1
+            return Entry(*row)
+
+    def put(self, key, value, path: str, zones=()):
+        now     = self.clock()
+        expires = now + self.ttl
+        for zone in zones:
+            if getattr(zone, 'key', None):
+                expires = next_transition(zone, now, expires) or expires
+        with self._lock:
+            db = self._connection()
+            db.execute('INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)',
+                       (key, self.settings, self.tzdata, str(value), path, expires, now))
+            self._inserts += 1
+            if self._inserts % self.prune_every:
+                return
+            excess = db.execute('SELECT count(*) FROM answers').fetchone()[0] - self.maxsize
+            if excess > 0:
+                db.execute('DELETE FROM answers WHERE (key, settings, tzdata) IN '
+                           '(SELECT key, settings, tzdata FROM answers ORDER BY accessed LIMIT ?)', (excess,))
+
+    def purge(self):
+        '''Delete expired entries and those answered with other tzdata; returns how many were deleted.'''
+        with self._lock:
+            return self._connection().execute('DELETE FROM answers WHERE expires <= ? OR tzdata != ?',
+                                              (self.clock(), self.tzdata)).rowcount
+
+    def clear(self):
+        with self._lock:
+            self._connection().execute('DELETE FROM answers')
+
+    def stats(self):
+        return {'size': len(self), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,27 @@
+import shlex
+import sys
+
+from .core import TimezoneCore
+
+
+def main(argv=None):
+    # 'python -m src.cli "What is the 2PM CEST in Taiwan Time?"' answers locally without importing
+    # symai; the model client is only loaded for questions the parser cannot answer
+    argv    = sys.argv[1:] if argv is None else argv
+    request = ' '.join(argv).strip()
+    if not request:
+        print('usage: python -m src.cli "<your query>"', file=sys.stderr)
+        return 2
+    if request.startswith('--stream'):
+        # 'python -m src.cli --stream -c ts --from UTC --to Asia/Tokyo data.csv -o out.csv' reads and writes
+        # files, so it is only run from the command line and never for a request to the pipeline or a server
+        from . import stream
+        rows = stream.main(shlex.split(request) if len(argv) == 1 else argv)
+        print(f'Converted {rows} rows.', file=sys.stderr)
+        return 0
+    print(TimezoneCore().forward(request))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import json
+import os
+import socket
+
+
+# where Timezone sends its requests when no server is given: a Unix socket path or host:port
+SERVER_ENV = 'TIMEZONE_SERVER'
+
+
+def parse_address(address):
+    # ('unix', path) for socket paths, ('tcp', (host, port)) for 'host:port' and ':port'
+    host, _, port = address.rpartition(':')
+    if port.isdigit() and '/' not in address:
+        return 'tcp', (host or '127.0.0.1', int(port))
+    return 'unix', os.path.expanduser(address)
+
+
+def connect(address, timeout: float = 30.0):
+    family, target = parse_address(address)
+    if family == 'tcp':
+        return socket.create_connection(target, timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def request(address, message, timeout: float = 30.0):
+    '''Send one JSON message to a ``src.server`` and return its JSON response.
+
+    Raises ``OSError`` when the server cannot be reached and ``RuntimeError`` for errors it reports.
+    '''
+    with connect(address, timeout) as sock:
+        sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError(f'{address} closed the connection without a response')
+    response = json.loads(line)
+    if 'error' in response:
+        raise RuntimeError(response['error'])
+    return response
+
+
+def ask(address, query, k: int = 10, timeout: float = 30.0, **options):
+    # options are the pipeline's constructor options (structured=True, local=False, ...); the server
+    # builds a pipeline for each set of them on first use
+    response = request(address, {'query': query, 'k': k, **options}, timeout)
+    return response['answer'], response['path'], response['cached']
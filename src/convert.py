@@ -0,0 +1,93 @@
+from datetime import timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from .parser import resolve
+from .transitions import fixed, load_transitions
+from .zones import tzdata_file
+
+
+@lru_cache(maxsize=4096)
+def zone_key(name):
+    # the TZ identifier a name stands for, or the offset in seconds of fixed ones such as 'CEST' and 'UTC+5:30'
+    if name == 'UTC':
+        return 0
+    if tzdata_file(name) is not None:
+        return name
+    zones = resolve(name)
+    if not zones or len(zones) != 1:
+        raise ValueError(f'unknown or ambiguous time zone {name!r}')
+    zone = zones[0]
+    if isinstance(zone, ZoneInfo):
+        return zone.key
+    return int(zone.utcoffset(None) // timedelta(seconds=1))
+
+
+def zone_transitions(name):
+    '''Transitions for a TZ identifier, or anything the parser resolves to a single zone ('JP', 'CEST', 'UTC+5:30').'''
+    key = zone_key(name)
+    if isinstance(key, int):
+        return fixed(name, key)
+    return load_transitions(key)
+
+
+def _by_zone(zones, size):
+    # (transitions, row mask) per distinct zone; a single name covers every row
+    if isinstance(zones, str):
+        return [(zone_transitions(zones), slice(None))]
+    zones = np.asarray(zones)
+    if zones.shape != (size,):
+        raise ValueError(f'expected one zone per timestamp, got shape {zones.shape} for {size} timestamps')
+    names, inverse = _factorize(zones)
+    order  = np.argsort(inverse, kind='stable')
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(names)))
+    return [(zone_transitions(str(name)), order[start:end])
+            for name, start, end in zip(names, np.concatenate(([0], bounds[:-1])), bounds)]
+
+
+def _factorize(zones):
+    # np.unique sorts the strings themselves, which dominates for millions of rows; hashing the
+    # code points of fixed-width strings lets it sort integers instead
+    if zones.dtype.kind == 'U' and zones.size and zones.dtype.itemsize:
+        codes   = np.ascontiguousarray(zones).view(np.uint32).reshape(zones.size, -1).astype(np.uint64)
+        weights = np.random.default_rng(0).integers(1, 2 ** 63, codes.shape[1], dtype=np.uint64) | np.uint64(1)
+        _, first, inverse = np.unique(codes @ weights, return_index=True, return_inverse=True)
+        names = zones[first]
+        # a collision would put two names in one group
+        if (names[inverse] == zones).all():
+            return names, inverse
+    return np.unique(zones, return_inverse=True)
+
+
+def convert_many(timestamps, from_zone, to_zone):
+    '''Convert wall-clock ``datetime64`` timestamps from one zone to another.
+
+    ``from_zone`` and ``to_zone`` are single names or arrays with one name per timestamp. Each distinct
+    zone is handled with one ``searchsorted`` over its transition table, so DST is applied exactly and
+    nothing loops over the timestamps in Python. Ambiguous local times take the earlier instant and
+    nonexistent ones are shifted forward, as ``zoneinfo`` does with ``fold=0``. NaT stays NaT.
+    '''
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind != 'M':
+        timestamps = timestamps.astype('datetime64[s]')
+    unit = np.datetime_data(timestamps.dtype)[0]
+    if unit in ('Y', 'M', 'W', 'D', 'h', 'm'):
+        timestamps = timestamps.astype('datetime64[s]')
+    shape      = timestamps.shape
+    timestamps = timestamps.ravel()
+    missing    = np.isnat(timestamps)
+    seconds    = np.where(missing, 0, timestamps.astype('datetime64[s]').astype(np.int64))
+
+    utc = np.empty_like(seconds)
+    for transitions, rows in _by_zone(from_zone, len(seconds)):
+        utc[rows] = transitions.to_utc(seconds[rows])
+    local = np.empty_like(seconds)
+    for transitions, rows in _by_zone(to_zone, len(seconds)):
+        local[rows] = transitions.to_local(utc[rows])
+
+    # shift by whole seconds so that sub-second precision survives
+    result = timestamps + (local - seconds).astype('timedelta64[s]')
+    result[missing] = np.datetime64('NaT')
+    return result.reshape(shape)
@@ -0,0 +1,350 @@
+import os
+from collections import namedtuple
+from heapq import nlargest
+from itertools import zip_longest
+from operator import itemgetter
+from time import perf_counter
+
+from .cache import ResponseCache
+from .client import SERVER_ENV
+from .exact import exact_index
+from .gazetteer import MIN_SCORE, place_index
+from .parser import extract_places, normalize, parse_query
+from .prompt import PromptBuilder, estimate_tokens
+from .result import ResultError, TimeResult, parse_reply, verify
+from .search import adaptive_cut, trigram_index
+from .stats import PipelineStats
+from .zones import abbreviations, zone_index
+
+
+EXTRACTION_MODES = ('local', 'llm', 'fold')
+# constructor options sent along with every request to a server, so it answers with the same pipeline
+REMOTE_OPTIONS = ('local', 'extraction', 'token_budget', 'cache_static', 'min_score', 'score_gap', 'structured', 'hybrid')
+
+Plan = namedtuple('Plan', 'request query key data result')
+
+
+class Answer(namedtuple('Answer', 'value path cached')):
+    def __str__(self):
+        return str(self.value)
+
+
+class TimezoneCore:
+    '''The Timezone pipeline without the symai ``Expression`` base class.
+
+    symai (and asyncio, stream) are only imported when a request actually needs them, so local
+    and cached answers start without the model client. ``Timezone`` wraps the answers into symbols.
+    '''
+
+    def __init__(self, local: bool = True, extraction: str = 'local', token_budget: int = 512,
+                 cache_static: bool = True, cache: ResponseCache = None, stats: PipelineStats = None,
+                 server: str = None, min_score: float = 0.45, score_gap: float = 0.2, structured: bool = False,
+                 hybrid: bool = False):
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f'extraction must be one of {EXTRACTION_MODES}, got {extraction!r}')
+        # answer parseable conversions with zoneinfo and only call the model for the rest
+        self.local  = local
+        # how the places are found for retrieval: the rule-based parser ('local'), a separate
+        # model call ('llm'), or not at all and left to the single answering call ('fold')
+        self.extraction = extraction
+        # model answers are cached; local answers are cheaper to recompute than to look up
+        self.cache  = cache
+        # per-stage latencies, tokens and answer paths; None skips all timing
+        self.stats  = stats
+        # a resident src.server to send requests to, TIMEZONE_SERVER by default; '' answers in process.
+        # A cache or stats object of the caller's own cannot be used there, so those answer in process too
+        if server is None:
+            server = os.environ.get(SERVER_ENV, '') if cache is None and stats is None else ''
+        self.server = server
+        # retrieval keeps the rows down to the first score below min_score or score_gap below the
+        # previous one, up to k; score_gap=None always keeps k rows
+        self.min_score = min_score
+        self.score_gap = score_gap
+        # conversions are answered as TimeResult instead of text, the model replies with short JSON
+        self.structured = structured
+        # queries the parser is not confident about are settled locally when the open readings agree;
+        # the model is only asked when they do not, and its answer is checked against local arithmetic
+        self.hybrid = hybrid
+        self.token_budget = token_budget
+        self.cache_static = cache_static
+        self.prompt_builder = PromptBuilder(token_budget, cache_static, structured or hybrid)
+        self._fn    = None
+
+    @property
+    def fn(self):
+        # the model Function is built on the first request that needs it
+        if self._fn is None:
+            from symai import Function
+            self._fn = Function(self.prompt_builder.static())
+        return self._fn
+
+    @fn.setter
+    def fn(self, fn):
+        self._fn = fn
+
+    def find_substring(self, country, k: int = 10):
+        # table line -> score of the k best rows, with the identifiers in their original case
+        lines = zone_index().lines
+        similarities = {lines[row]: score for row, score in self.retrieve(country, k)}
+        return similarities
+
+    def resolve_exact(self, name):
+        # ExactMatch for identifiers, links, country codes and abbreviations, None for anything else
+        return exact_index().lookup(name)
+
+    def retrieve(self, country, k: int = 10):
+        # names that identify zones outright skip the fuzzy stages
+        match = exact_index().lookup(country)
+        if match is not None:
+            return [(row, 1.0) for row in match.rows[:k]]
+        # zones of the closest gazetteer places come first, then fuzzy matches over the zone rows
+        rows = {}
+        for _, place_rows, score in place_index().search(country, k):
+            if score >= MIN_SCORE:
+                for row in place_rows:
+                    rows.setdefault(row, score)
+        for row, score in trigram_index().search(country, k):
+            rows.setdefault(row, score)
+        # a stable selection, so gazetteer rows stay ahead of trigram rows with the same score
+        ranked = nlargest(k, rows.items(), key=itemgetter(1))
+        if self.score_gap is None:
+            return ranked
+        return adaptive_cut(ranked, self.min_score, self.score_gap)
+
+    def retrieve_places(self, places, k: int = 10):
+        # interleave the per-place rankings so source and target zones both reach the prompt
+        rankings = [[row for row, _ in self.retrieve(place, k)] for place in places]
+        rows     = {}
+        for rank in zip_longest(*rankings):
+            rows.update(dict.fromkeys(row for row in rank if row is not None))
+        return list(rows)[:k]
+
+    def extract_places(self, request, query):
+        if self.extraction == 'llm':
+            if not hasattr(request, 'extract'):
+                from symai import Symbol
+                request = Symbol(request)
+            places = request.extract('extract the source and target timezones, countries or places, separated by semicolons')
+            places = [place.strip() for place in str(places).split(';') if place.strip()]
+        elif self.extraction == 'local':
+            places = extract_places(query)
+        else:
+            places = []
+        return places or [str(request)]
+
+    def involved_rows(self, query, per_abbreviation: int = 3):
+        # rows of the zones the parser recognized, ahead of the retrieved ones
+        index = zone_index()
+        rows  = []
+        for mention in query.mentions:
+            for zone in mention.zones:
+                if getattr(zone, 'key', None) in index.by_name:
+                    rows.append(index.by_name[zone.key])
+                else:
+                    offset = int(zone.utcoffset(None).total_seconds() // 60)
+                    rows.extend(abbreviations().get(mention.text, {}).get(offset, [])[:per_abbreviation])
+        return rows
+
+    def plan(self, request, k: int = 10):
+        # everything up to the model call: parsing, the local answer, the cache lookup and retrieval
+        if self.local and 'which' in str(request).lower():
+            # 'which zones are at UTC+05:30 now?' is answered from the reverse index
+            from .reverse import answer
+            result = self._stage('local', answer, str(request))
+            if result is not None:
+                return Plan(request, None, None, None, self._result(result, 'local'))
+        query         = self._stage('parse', parse_query, str(request))
+        if self.local and query.confident:
+            return Plan(request, query, None, None, self._result(self._stage('local', self._convert, query), 'local'))
+        if self.local and self.hybrid:
+            conversion = self._stage('local', query.settle)
+            if conversion is not None:
+                return Plan(request, query, None, None, self._result(self._present(conversion), 'local'))
+        key           = None
+        if self.cache is not None:
+            key   = self.cache.key(query)
+            if self.structured or self.hybrid:
+                key = f"{'structured' if self.structured else 'hybrid'} {key}"
+            entry = self._lookup(key)
+            if entry is not None:
+                value = TimeResult.from_json(entry.value) if self.structured else entry.value
+                return Plan(request, query, key, None, self._result(value, entry.path, cached=True))
+        rows          = self.involved_rows(query)
+        # places the parser already resolved are covered by their rows
+        resolved      = {mention.text for mention in query.mentions}
+        places        = [place for place in self._stage('extract', self.extract_places, request, query)
+                         if place not in resolved]
+        # get top k rows
+        if places or not rows:
+            rows     += self._stage('retrieve', self.retrieve_places, places or [str(request)], k)
+        # tell the model which readings an ambiguous abbreviation or country code has
+        notes         = [match.describe() for match in map(self.resolve_exact, dict.fromkeys(mention.text for mention in query.mentions))
+                         if match is not None and match.ambiguous]
+        return Plan(request, query, key, self._stage('prompt', self.prompt_builder.build, request, rows, notes), None)
+
+    def finish(self, plan, result):
+        verified = None
+        if self.structured or self.hybrid:
+            try:
+                result = parse_reply(result)
+            except ResultError:
+                if not self.hybrid:
+                    raise
+                # a reply outside the schema cannot be checked; it is returned flagged and not cached
+                return self._result(self._unreadable(str(result)), 'llm')
+        if self.hybrid:
+            result.issues   = verify(result, plan.query)
+            result.verified = verified = not result.issues
+            if not self.structured:
+                result = self._flagged(result)
+        # answers that disagree with local arithmetic are returned flagged, but never cached
+        if self.cache is not None and verified is not False:
+            zones = [zone for mention in plan.query.mentions for zone in mention.zones]
+            self.cache.put(plan.key, str(result), 'llm', zones)
+        return self._result(result, 'llm')
+
+    def forward(self, request, k: int = 10, *args, **kwargs):
+        if self.server:
+            answer = self._remote(request, k)
+            if answer is not None:
+                return answer
+        start = perf_counter()
+        plan  = self.plan(request, k)
+        if plan.result is None:
+            plan = plan._replace(result=self.finish(plan, self._model(plan.data, *args, **kwargs)))
+        if self.stats is not None:
+            self.stats.record('total', perf_counter() - start)
+        return plan.result
+
+    async def aforward(self, request, k: int = 10, *args, **kwargs):
+        import asyncio
+        if self.server:
+            answer = await asyncio.to_thread(self._remote, request, k)
+            if answer is not None:
+                return answer
+        start = perf_counter()
+        plan  = self.plan(request, k)
+        if plan.result is None:
+            # the model client is synchronous, so the call runs in a worker thread
+            result = await asyncio.to_thread(self._model, plan.data, *args, **kwargs)
+            plan   = plan._replace(result=self.finish(plan, result))
+        if self.stats is not None:
+            self.stats.record('total', perf_counter() - start)
+        return plan.result
+
+    async def aforward_many(self, requests, k: int = 10, concurrency: int = 8, *args, **kwargs):
+        # identical normalized requests are answered once; all plans (and so all retrieval) are made
+        # before any model call, and at most ``concurrency`` model calls run at the same time
+        import asyncio
+        plans     = {}
+        positions = []
+        for request in requests:
+            query = parse_query(str(request))
+            key   = normalize(query) if query.mentions else ' '.join(str(request).lower().split())
+            if key not in plans:
+                # with a server the requests are only deduplicated here and planned there
+                plans[key] = request if self.server else self._plan_or_error(request, k)
+            positions.append(key)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(plan):
+            if isinstance(plan, Exception):
+                return plan
+            if self.server:
+                async with semaphore:
+                    return await self.aforward(plan, k, *args, **kwargs)
+            if plan.result is not None:
+                return plan.result
+            async with semaphore:
+                result = await asyncio.to_thread(self._model, plan.data, *args, **kwargs)
+            return self.finish(plan, result)
+
+        # a request that fails gets its exception in place of the answer, the others are still returned
+        answers = await asyncio.gather(*(run(plan) for plan in plans.values()), return_exceptions=True)
+        results = dict(zip(plans, answers))
+        return [results[key] for key in positions]
+
+    def _plan_or_error(self, request, k):
+        # a request that cannot be planned fails on its own, not the batch it came in
+        try:
+            return self.plan(request, k)
+        except Exception as error:
+            return error
+
+    def forward_many(self, requests, k: int = 10, concurrency: int = 8, *args, **kwargs):
+        # blocking wrapper around aforward_many; use the coroutine from inside a running event loop
+        import asyncio
+        return asyncio.run(self.aforward_many(requests, k, concurrency, *args, **kwargs))
+
+    def _remote(self, request, k):
+        # the server's answer, or None to answer in process when it cannot be reached
+        from .client import ask
+        options = {name: getattr(self, name) for name in REMOTE_OPTIONS}
+        try:
+            value, path, cached = ask(self.server, str(request), k, **options)
+        except TimeoutError:
+            # the server may still be waiting for the model; asking again here would pay for the call twice
+            raise
+        except OSError:
+            return None
+        if self.structured and value.startswith('{'):
+            value = TimeResult.from_json(value)
+        return self._result(value, path, cached)
+
+    def _convert(self, query):
+        return self._present(query.convert())
+
+    def _present(self, conversion):
+        if self.structured:
+            return TimeResult.from_conversion(conversion)
+        return str(conversion)
+
+    def _flagged(self, result):
+        # the text of a checked model answer, with what did not match local arithmetic
+        text = str(result.to_conversion())
+        if result.issues:
+            text += f" Not verified: {'; '.join(result.issues)}."
+        return text
+
+    def _unreadable(self, reply):
+        issue = 'reply is not in the result schema'
+        if self.structured:
+            return TimeResult.unreadable(reply, issue)
+        return f'{reply} Not verified: {issue}.'
+
+    def _stage(self, stage, call, *args):
+        if self.stats is None:
+            return call(*args)
+        start  = perf_counter()
+        result = call(*args)
+        self.stats.record(stage, perf_counter() - start)
+        return result
+
+    def _lookup(self, key):
+        if self.stats is None:
+            return self.cache.get(key)
+        start = perf_counter()
+        entry = self.cache.get(key)
+        self.stats.record('cache', perf_counter() - start, hit=entry is not None)
+        return entry
+
+    def _model(self, data, *args, **kwargs):
+        if self.stats is None:
+            return self.fn(data, *args, **kwargs)
+        start  = perf_counter()
+        result = self.fn(data, *args, **kwargs)
+        # tokens of the static prompt the Function was built with plus the per-call data
+        tokens = estimate_tokens(self.prompt_builder.static()) + estimate_tokens(data)
+        self.stats.record('model', perf_counter() - start, tokens_in=tokens, tokens_out=estimate_tokens(str(result)))
+        return result
+
+    def _result(self, result, path, cached: bool = False):
+        if self.stats is not None:
+            self.stats.answered(path, cached)
+        return self._answer(result, path, cached)
+
+    def _answer(self, result, path, cached: bool = False):
+        if isinstance(result, TimeResult):
+            result.path, result.cached = path, cached
+            return result
+        return Answer(result, path, cached)
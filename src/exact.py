@@ -0,0 +1,108 @@
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain, zip_longest
+
+from .artifact import artifact
+from .gazetteer import places
+from .zones import US_ABBREVIATIONS, abbreviations, dominant_offsets, format_offset, zone_index
+
+
+class ExactMatch(namedtuple('ExactMatch', 'text kind rows readings')):
+    '''A name that identifies zones outright.
+
+    ``kind`` is 'identifier', 'alias' (a Link; ``rows`` holds the link and then its canonical zone),
+    'country' (an ISO 3166 code) or 'abbreviation'. ``readings`` are the distinct UTC offsets in minutes
+    the name stands for; more than one makes the match ambiguous ('IST', 'CST').
+    '''
+
+    @property
+    def ambiguous(self):
+        return len(self.readings) > 1
+
+    def describe(self):
+        # 'IST is ambiguous: UTC+01:00 (Europe/Dublin), UTC+02:00 (Asia/Jerusalem), UTC+05:30 (Asia/Kolkata)'
+        index    = zone_index()
+        readings = {}
+        for row in self.rows:
+            offset = index.std[row] if index.std[row] in self.readings else index.dst[row]
+            if offset in self.readings:
+                readings.setdefault(offset, index.name[row])
+        choices = ', '.join(f'UTC{format_offset(offset)} ({name})' for offset, name in sorted(readings.items()))
+        return f'{self.text} is ambiguous: {choices}' if self.ambiguous else f'{self.text} is {choices}'
+
+
+class ExactIndex:
+    '''Dictionary lookups for TZ identifiers, links, ISO country codes and STD/DST abbreviations.
+
+    Abbreviations include the DST names (CEST, BST, PDT) read from the system tzdata. Nothing is
+    scored: a name either identifies its zones or is left to the fuzzy stages.
+    '''
+
+    def __init__(self, index):
+        self.index       = index
+        self.identifiers = {name.lower(): row for row, name in enumerate(index.name) if '/' in name}
+        self.countries   = places()[1]
+        self.abbrs       = abbreviations()
+        loaded           = artifact()
+        self._aliases    = loaded.header['aliases'] if loaded is not None else None
+        self._targets    = {}
+
+    def target(self, row):
+        # canonical row of a Link row; the embedded table does not name targets, but a link's
+        # TZif file is its target's, which narrows down to the canonical rows with the same offsets
+        if row not in self._targets:
+            index = self.index
+            if self._aliases is not None:
+                target = index.by_name.get(self._aliases.get(index.name[row]))
+            else:
+                data   = self._data(index.name[row])
+                target = next((candidate for candidate in range(len(index))
+                               if index.kind[candidate] == 'Canonical' and index.std[candidate] == index.std[row]
+                               and index.dst[candidate] == index.dst[row] and data is not None
+                               and self._data(index.name[candidate]) == data), None)
+            self._targets[row] = target
+        return self._targets[row]
+
+    def _data(self, name):
+        # TZif bytes of a zone, None for names without a file; src.transitions brings NumPy along
+        from .transitions import tzif_data
+        try:
+            return tzif_data(name)
+        except ValueError:
+            return None
+
+    def _preference(self, row):
+        name = self.index.name[row]
+        return self.index.kind[row] != 'Canonical', '/' not in name or name.startswith('Etc/'), row
+
+    def lookup(self, text):
+        index = self.index
+        text  = text.strip()
+        row   = index.by_name.get(text)
+        if row is None:
+            row = self.identifiers.get(text.lower())
+        if row is not None:
+            reading = (index.std[row],)
+            if index.kind[row] == 'Link' and self.target(row) is not None:
+                return ExactMatch(text, 'alias', (row, self.target(row)), reading)
+            return ExactMatch(text, 'identifier', (row,), reading)
+        if text.isupper() or text == 'ChST':
+            offsets = self.abbrs.get(text)
+            if offsets:
+                readings = tuple(dominant_offsets(offsets))
+                # canonical geographic zones first within a reading, and the readings interleaved
+                # so that each of them reaches the top rows
+                groups   = [sorted(offsets[offset], key=self._preference) for offset in readings]
+                rows     = tuple(dict.fromkeys(row for row in chain.from_iterable(zip_longest(*groups)) if row is not None))
+                return ExactMatch(text, 'abbreviation', rows, readings)
+            if len(text) == 2 and text in self.countries:
+                # with the zones of a US state sharing the code ('GA' is Gabon or Georgia)
+                rows = tuple(self.countries[text]) + tuple(index.by_name[name] for name in US_ABBREVIATIONS.get(text, ())
+                                                           if name in index.by_name)
+                return ExactMatch(text, 'country', rows, tuple(dict.fromkeys(index.std[row] for row in rows)))
+        return None
+
+
+@lru_cache(maxsize=None)
+def exact_index():
+    return ExactIndex(zone_index())
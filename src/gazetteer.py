@@ -0,0 +1,108 @@
+import os
+import unicodedata
+import zlib
+from functools import lru_cache
+
+from .zones import country_names, zone_index
+
+
+GAZETTEER  = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer.tsv')
+# width of the hashed n-gram vectors
+DIMENSIONS = 1024
+# cosine score from which a place name counts as a match ('Bangalor' scores 0.74 against 'bangalore')
+MIN_SCORE  = 0.5
+
+
+@lru_cache(maxsize=None)
+def read_gazetteer(path=GAZETTEER):
+    # place -> TZ identifier
+    places = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or '\t' not in line:
+                continue
+            place, zone = line.rstrip('\n').split('\t')[:2]
+            places[place] = zone
+    return places
+
+
+@lru_cache(maxsize=None)
+def places():
+    # lower-cased place name -> rows, from city names in TZ identifiers, ISO country names and the gazetteer
+    index  = zone_index()
+    places = {}
+    by_country = {}
+    for entry, code in enumerate(index.country):
+        by_country.setdefault(code, []).append(index.row[entry])
+    for code, rows in by_country.items():
+        # zones that list the country first: 'DE' is Europe/Berlin, not Europe/Zurich (which also covers Büsingen)
+        by_country[code] = [row for row in rows if index.country[index.row_start[row]] == code] or rows
+    for row, name in enumerate(index.name):
+        if '/' in name and not name.startswith('Etc/'):
+            places.setdefault(name.rsplit('/', 1)[-1].replace('_', ' ').lower(), []).append(row)
+    for name, code in country_names().items():
+        if code in by_country:
+            places.setdefault(name, by_country[code])
+    for place, zone in read_gazetteer().items():
+        if zone in index.by_name:
+            places.setdefault(place.lower(), [index.by_name[zone]])
+    return places, by_country
+
+
+def fold(text):
+    # 'São Paulo' and 'Sao Paulo' get the same features
+    return ''.join(char for char in unicodedata.normalize('NFKD', text.lower()) if not unicodedata.combining(char))
+
+
+def features(text):
+    # hashed character trigrams of each word plus the whole words
+    words  = fold(text).replace('_', ' ').replace('/', ' ').split()
+    hashes = []
+    for word in words:
+        padded = f' {word} '
+        hashes.extend(zlib.crc32(padded[i:i + 3].encode('utf-8')) % DIMENSIONS for i in range(len(padded) - 2))
+        hashes.append(zlib.crc32(word.encode('utf-8')) % DIMENSIONS)
+    return hashes
+
+
+class PlaceIndex:
+    '''Hashed n-gram vectors of every known place name, searched with one matrix product.
+
+    Each name is embedded as a unit vector of ``DIMENSIONS`` hashed trigram and word counts, stored
+    transposed so that a query, embedded the same way, only multiplies the rows of its few non-zero
+    features. The best ``k`` cosine scores are selected with ``argpartition``.
+    '''
+
+    def __init__(self, places):
+        import numpy as np
+        self.names  = list(places)
+        self.rows   = [tuple(dict.fromkeys(places[name])) for name in self.names]
+        hashes      = [features(name) for name in self.names]
+        entries     = np.repeat(np.arange(len(hashes)), [len(name) for name in hashes])
+        self.matrix = np.zeros((len(self.names), DIMENSIONS), np.float32)
+        np.add.at(self.matrix, (entries, np.concatenate(hashes)), 1.0)
+        self.matrix /= np.maximum(np.linalg.norm(self.matrix, axis=1, keepdims=True), 1e-9)
+        # features x names
+        self.matrix = np.ascontiguousarray(self.matrix.T)
+
+    def vector(self, text):
+        import numpy as np
+        vector = np.bincount(features(text), minlength=DIMENSIONS).astype(np.float32)
+        norm   = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, text, k: int = 10):
+        # [(name, rows, score)] of the k closest names, best first
+        import numpy as np
+        vector = self.vector(text)
+        active = np.flatnonzero(vector)
+        scores = vector[active] @ self.matrix[active]
+        k      = min(k, len(scores))
+        top    = np.argpartition(-scores, k - 1)[:k]
+        top    = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.names[i], self.rows[i], float(scores[i])) for i in top]
+
+
+@lru_cache(maxsize=None)
+def place_index():
+    return PlaceIndex(places()[0])
@@ -0,0 +1,113 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .convert import zone_transitions
+
+
+DAY = 86400
+
+# start and end are UTC ``datetime64[m]``; missing lists the participants who cannot attend
+Slot = namedtuple('Slot', 'start end attendees missing')
+
+
+def _minutes(value):
+    # 9, 9.5 or '09:30' as minutes after midnight
+    if isinstance(value, str):
+        hours, _, minutes = value.partition(':')
+        return int(hours) * 60 + int(minutes or 0)
+    return int(round(value * 60))
+
+
+def _participant(participant, hours):
+    # 'Asia/Tokyo', ('Berlin', 8, 18) or ('Tokyo', '09:00', '17:30')
+    if isinstance(participant, str):
+        zone, start, end = participant, *hours
+    else:
+        zone, start, end = participant
+    return zone, _minutes(start), _minutes(end)
+
+
+class Availability:
+    '''Working hours of many participants on a UTC slot grid.
+
+    Participants sharing a zone and window are evaluated once: the grid is converted to the zone's
+    local time with one ``searchsorted`` over its transitions, so DST changes inside the range move
+    the window on exactly the right day. ``free[g, i]`` tells whether group ``g`` can attend slot ``i``.
+    '''
+
+    def __init__(self, participants, first, last, hours=(9, 17), slot: int = 30, weekdays: bool = True):
+        if slot <= 0:
+            raise ValueError(f'slot must be a positive number of minutes, got {slot}')
+        first       = np.datetime64(first, 'D')
+        last        = np.datetime64(last, 'D') + 1
+        self.slot   = slot
+        self.starts = np.arange(first.astype('datetime64[m]'), last.astype('datetime64[m]'), slot)
+        self.labels = []
+        groups      = {}
+        for participant in participants:
+            zone, start, end = _participant(participant, hours)
+            groups.setdefault((zone, start, end), []).append(len(self.labels))
+            self.labels.append(zone)
+        self.members = list(groups.values())
+        self.weights = np.array([len(members) for members in self.members], np.int64)
+        instants     = self.starts.astype(np.int64) * 60
+        self.free    = np.empty((len(groups), len(instants)), bool)
+        for row, (zone, start, end) in enumerate(groups):
+            local  = zone_transitions(zone).to_local(instants)
+            minute = local % DAY // 60
+            if start <= end:
+                free = (minute >= start) & (minute + slot <= end)
+            else:
+                # a window across midnight, such as a night shift from 22:00 to 06:00
+                free = (minute >= start) | (minute + slot <= end)
+            if weekdays:
+                # 1970-01-01 was a Thursday, Monday is 0
+                free &= (local // DAY + 3) % 7 < 5
+            self.free[row] = free
+
+    def fits(self, duration: int):
+        # whether each group is free for ``duration`` minutes from each slot on
+        if duration <= 0:
+            raise ValueError(f'duration must be a positive number of minutes, got {duration}')
+        length = -(-duration // self.slot)
+        total  = np.concatenate((np.zeros((len(self.free), 1), np.int32), np.cumsum(self.free, axis=1, dtype=np.int32)), axis=1)
+        return total[:, length:] - total[:, :-length] == length, length
+
+    def missing(self, fits, index):
+        return tuple(self.labels[member] for row in np.flatnonzero(~fits[:, index]) for member in self.members[row])
+
+
+def find_slots(participants, first, last, duration: int = 60, hours=(9, 17), slot: int = 30,
+               weekdays: bool = True, top: int = 10, min_attendees: int = 1):
+    '''Best meeting slots between the dates ``first`` and ``last`` (inclusive, UTC days).
+
+    Participants are zone names or anything the parser resolves to one zone, alone (working ``hours``)
+    or as ``(zone, start, end)`` with their own window. Slots are ranked by how many participants can
+    attend for the whole ``duration``, then by time; the returned slots do not overlap.
+    '''
+    availability = Availability(participants, first, last, hours, slot, weekdays)
+    fits, length = availability.fits(duration)
+    attendees    = availability.weights @ fits
+    order        = np.lexsort((np.arange(len(attendees)), -attendees))
+    taken        = np.zeros(len(availability.starts), bool)
+    slots        = []
+    for index in order:
+        if len(slots) == top or attendees[index] < min_attendees:
+            break
+        if taken[index:index + length].any():
+            continue
+        taken[index:index + length] = True
+        start = availability.starts[index]
+        slots.append(Slot(start, start + np.timedelta64(duration, 'm'), int(attendees[index]),
+                          availability.missing(fits, index)))
+    return slots
+
+
+def common_hours(participants, first, last, hours=(9, 17), slot: int = 30, weekdays: bool = True):
+    '''UTC ``(start, end)`` intervals in which every participant is within their working hours.'''
+    availability = Availability(participants, first, last, hours, slot, weekdays)
+    common       = np.concatenate(([False], availability.free.all(axis=0), [False]))
+    edges        = np.flatnonzero(np.diff(common.astype(np.int8)))
+    starts       = availability.starts[edges[::2]]
+    return list(zip(starts, starts + (edges[1::2] - edges[::2]) * np.timedelta64(slot, 'm')))
@@ -0,0 +1,123 @@
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+
+import numpy as np
+
+from .convert import convert_many
+from .stream import _chunks
+
+
+# the pipeline of a worker process, built by _start
+_pipeline = None
+
+
+def warm():
+    # build the read-only indexes once; forked workers inherit them instead of rebuilding them
+    from .exact import exact_index
+    from .gazetteer import place_index
+    from .search import trigram_index
+    from .zones import abbreviations, zone_index
+    zone_index(), abbreviations(), trigram_index(), place_index(), exact_index()
+
+
+def _start(options):
+    global _pipeline
+    from .core import TimezoneCore
+    _pipeline = TimezoneCore(**{'server': '', **options})
+
+
+def _answer(requests):
+    return [_pipeline.forward(request) for request in requests]
+
+
+def _convert(job):
+    # converts rows start:end of the arrays saved in directory into its output file
+    directory, start, end, from_zone, to_zone = job
+
+    def column(name):
+        return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')[start:end]
+
+    output = np.load(os.path.join(directory, 'output.npy'), mmap_mode='r+')
+    output[start:end] = convert_many(column('timestamps'), from_zone or column('from_zone'), to_zone or column('to_zone'))
+    output.flush()
+
+
+class ShardedPool:
+    '''Spreads query batches and bulk conversions over worker processes.
+
+    Inputs are cut into shards of ``chunk_size``; at most ``window`` shards are in flight, so memory stays
+    bounded for streams of any length, and results come back in input order. Where processes are forked
+    the indexes are built once in the parent and inherited; elsewhere the workers map the same compiled
+    artifact, so the zone data is shared through the page cache either way. ``options`` configure the
+    ``TimezoneCore`` of every worker.
+    '''
+
+    def __init__(self, workers: int = None, chunk_size: int = 256, window: int = None, **options):
+        self.workers    = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.window     = window or 2 * self.workers
+        methods         = multiprocessing.get_all_start_methods()
+        context         = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        if context.get_start_method() == 'fork':
+            warm()
+        self._pool      = context.Pool(self.workers, _start, (options,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        self._pool.terminate()
+        self._pool.join()
+
+    def map(self, function, jobs):
+        '''``function(job)`` for every job in order, with at most ``window`` jobs submitted ahead.'''
+        pending = deque()
+        for job in jobs:
+            pending.append(self._pool.apply_async(function, (job,)))
+            if len(pending) >= self.window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+    def forward(self, requests):
+        '''Answers to ``requests`` in order, yielded as the shards complete.'''
+        for answers in self.map(_answer, _chunks(requests, self.chunk_size)):
+            yield from answers
+
+    def forward_many(self, requests):
+        return list(self.forward(requests))
+
+    def convert_many(self, timestamps, from_zone, to_zone, chunk_size: int = 1 << 18):
+        '''``convert_many`` over shards of ``chunk_size`` timestamps.
+
+        The arrays are handed to the workers as memory-mapped files (in /dev/shm where there is one)
+        instead of being pickled, and every worker writes its rows straight into the output.
+        '''
+        timestamps = np.asarray(timestamps)
+        if timestamps.dtype.kind != 'M' or np.datetime_data(timestamps.dtype)[0] in ('Y', 'M', 'W', 'D', 'h', 'm'):
+            # the unit convert_many returns, so that the workers' rows fit the output
+            timestamps = timestamps.astype('datetime64[s]')
+        shape      = timestamps.shape
+        timestamps = timestamps.ravel()
+        root       = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        with tempfile.TemporaryDirectory(prefix='timezone-', dir=root) as directory:
+            np.save(os.path.join(directory, 'timestamps.npy'), timestamps)
+            np.save(os.path.join(directory, 'output.npy'), np.empty_like(timestamps))
+            for name, zones in (('from_zone', from_zone), ('to_zone', to_zone)):
+                if not isinstance(zones, str):
+                    # object arrays (pandas string columns) cannot be memory-mapped, fixed-width strings can
+                    np.save(os.path.join(directory, f'{name}.npy'), np.asarray(zones).astype(str).ravel())
+            single = [zones if isinstance(zones, str) else None for zones in (from_zone, to_zone)]
+            jobs   = ((directory, start, start + chunk_size, *single) for start in range(0, len(timestamps), chunk_size))
+            for _ in self.map(_convert, jobs):
+                pass
+            return np.load(os.path.join(directory, 'output.npy')).reshape(shape)
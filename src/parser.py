@@ -0,0 +1,295 @@
+import re
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from .gazetteer import places
+from .search import query_terms
+from .zones import US_ABBREVIATIONS, abbreviations, dominant_offsets, format_offset, zone_index
+
+
+_TIME       = re.compile(r'\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>[ap])\.?m\b\.?'
+                         r'|\b(?P<hour24>\d{1,2}):(?P<minute24>\d{2})\b'
+                         r'|\b(?P<word>noon|midnight)\b', re.I)
+_NOW        = re.compile(r'\b(?:now|current(?:ly)?|what time is it)\b', re.I)
+_DATE       = re.compile(r'\b(?P<iso>\d{4}-\d{2}-\d{2})\b|\b(?P<relative>today|tomorrow|yesterday)\b', re.I)
+_OFFSET     = re.compile(r'\b(?:UTC|GMT)\s*(?P<sign>[+\-−])\s*(?P<hours>\d{1,2})(?::?(?P<minutes>\d{2}))?(?![\d:])', re.I)
+_IDENTIFIER = re.compile(r'\b[A-Za-z][A-Za-z_-]*(?:/[A-Za-z0-9_+-]+)+')
+_WORD       = re.compile(r"[^\W\d_][\w'-]*")
+# shapes the rules below do not model (durations, differences, conditionals) are left to the model
+_UNSUPPORTED = re.compile(r'\b(?:when|if|difference|between|ago|after|before|later|earlier|hours?|minutes?|days?|weeks?)\b', re.I)
+_CONDITIONAL = re.compile(r'\b(?:if|when)\b', re.I)
+# readings of ambiguous source and target mentions compared by Query.settle
+_MAX_READINGS = 16
+_RELATIVE_DAYS = {'today': 0, 'tomorrow': 1, 'yesterday': -1}
+# generic North American names; they shadow the ISO codes of Ethiopia, Malta and Portugal
+_GENERIC    = {'ET': 'America/New_York', 'CT': 'America/Chicago', 'MT': 'America/Denver', 'PT': 'America/Los_Angeles'}
+# city names that are also ordinary words only count when capitalized
+_COMMON_WORDS = frozenset('center central christmas davis easter eastern midway mountain pacific reunion troll wake'.split())
+_MAX_WORDS  = 4
+_FILLER     = frozenset('What When Where Which How Is Convert Please Time Timezone Zone I AM PM'.split())
+
+
+@dataclass
+class Mention:
+    start: int
+    end:   int
+    text:  str
+    zones: tuple   # candidate tzinfo objects; more than one means the mention is ambiguous
+
+
+@dataclass
+class Conversion:
+    source:      datetime
+    target:      datetime
+    source_zone: str
+    target_zone: str
+
+    def __str__(self):
+        if self.source is None:
+            return f'It is currently {_format(self.target, self.target_zone)}.'
+        return f'{_format(self.source, self.source_zone)} is {_format(self.target, self.target_zone)}.'
+
+
+@dataclass
+class Query:
+    text:      str
+    time:      Optional[time] = None     # None together with ``now`` asks for the current time
+    now:       bool = False
+    date:      Optional[date] = None
+    days:      int = 0                   # today / tomorrow / yesterday
+    mentions:  list = field(default_factory=list)
+    source:    Optional[Mention] = None
+    target:    Optional[Mention] = None
+    supported: bool = True
+    spans:     list = field(default_factory=list)   # (start, end, canonical form) of the time and date
+
+    @property
+    def confident(self):
+        if not self.supported or self.target is None or len(self.target.zones) != 1:
+            return False
+        if self.time is None:
+            return self.now and self.source is None
+        return self.source is not None and len(self.source.zones) == 1
+
+    def convert(self, now: datetime = None):
+        now    = now or datetime.now(timezone.utc)
+        target = self.target.zones[0]
+        if self.time is None:
+            return Conversion(None, now.astimezone(target), None, _zone_name(target))
+        source = self.source.zones[0]
+        day    = self.date or now.astimezone(source).date()
+        local  = datetime.combine(day + timedelta(days=self.days), self.time, tzinfo=source)
+        return Conversion(local, local.astimezone(target), _zone_name(source), _zone_name(target))
+
+    def settle(self, now: datetime = None):
+        '''The conversion of a query that is not ``confident`` when what holds it back does not change the answer.
+
+        Conditional phrasings ('if it is 9am in Berlin, what time is it in Tokyo?') are read without the
+        condition, and an ambiguous mention counts when all of its readings give the same times.
+        Returns None when the answer is still open.
+        '''
+        now   = now or datetime.now(timezone.utc)
+        query = self
+        if not self.supported and _CONDITIONAL.search(self.text):
+            query = parse_query(_CONDITIONAL.sub(' ', self.text))
+        if not query.supported or query.target is None or (query.time is None and not (query.now and query.source is None)):
+            return None
+        if query.time is not None and query.source is None:
+            return None
+        readings = [(source, target) for source in (query.source.zones if query.source else (None,))
+                    for target in query.target.zones][:_MAX_READINGS]
+        results  = []
+        for source, target in readings:
+            single = replace(query, source=query.source and replace(query.source, zones=(source,)),
+                             target=replace(query.target, zones=(target,)))
+            results.append(single.convert(now))
+        # the same instants at the same wall-clock times, whichever reading is taken
+        if len({(result.source, result.source and result.source.utcoffset(), result.target.utcoffset())
+                for result in results}) != 1:
+            return None
+        return results[0]
+
+
+def _zone_name(tz):
+    return getattr(tz, 'key', None) or tz.tzname(None)
+
+
+def _canonical(tz):
+    if getattr(tz, 'key', None):
+        return tz.key
+    name = tz.tzname(None)
+    return name if name.startswith('UTC') else f'{name}{format_offset(int(tz.utcoffset(None).total_seconds() // 60))}'
+
+
+def _format(moment, zone):
+    offset = format_offset(int(moment.utcoffset().total_seconds() // 60))
+    text   = f"{moment.strftime('%I:%M %p').lstrip('0')} {moment.tzname()} (UTC{offset}) on {moment:%A, %Y-%m-%d}"
+    return text if zone == moment.tzname() else f'{text} in {zone}'
+
+
+def _pick(index, rows):
+    # prefer canonical rows; several zones with identical offsets are treated as one choice
+    rows = sorted(set(rows), key=lambda row: (index.kind[row] != 'Canonical', index.backzone[row], row))
+    if len({(index.std[row], index.dst[row]) for row in rows}) == 1:
+        rows = rows[:1]
+    return tuple(ZoneInfo(index.name[row]) for row in rows)
+
+
+def _offset_zone(match):
+    sign    = -1 if match['sign'] in '-−' else 1
+    minutes = sign * (int(match['hours']) * 60 + int(match['minutes'] or 0))
+    return timezone(timedelta(minutes=minutes), f'UTC{format_offset(minutes)}')
+
+
+def resolve(text):
+    index = zone_index()
+    lower = text.lower()
+    match = _OFFSET.fullmatch(text)
+    if match:
+        return (_offset_zone(match),)
+    # abbreviations before identifiers: the legacy zones CET, EET, WET and MET observe DST, while
+    # '2pm CET' means UTC+01:00 in summer too
+    offsets = abbreviations().get(text) if text.isupper() or text == 'ChST' else None
+    if offsets:
+        return tuple(timezone(timedelta(minutes=offset), text) for offset in dominant_offsets(offsets))
+    if text in index.by_name:
+        return (ZoneInfo(text),)
+    if text in _GENERIC:
+        return (ZoneInfo(_GENERIC[text]),)
+    names, by_country = places()
+    if len(text) == 2 and text.isupper() and text in by_country:
+        # 'LA' or 'GA' may as well be a US state or city, so such codes stay ambiguous
+        return _pick(index, by_country[text]) + tuple(ZoneInfo(name) for name in US_ABBREVIATIONS.get(text, ()))
+    if lower in names and not (lower in _COMMON_WORDS and text.islower()):
+        return _pick(index, names[lower])
+    return None
+
+
+def _mentions(text, taken):
+    mentions = []
+    for match in _IDENTIFIER.finditer(text):
+        zones = resolve(match.group())
+        if zones is None or any(start < match.end() and match.start() < end for start, end in taken):
+            continue
+        mentions.append(Mention(match.start(), match.end(), match.group(), zones))
+        taken.append(match.span())
+
+    words = [match for match in _WORD.finditer(text)
+             if not any(start < match.end() and match.start() < end for start, end in taken)]
+    i = 0
+    while i < len(words):
+        # longest run of adjacent words naming a place wins ('new york' before 'york')
+        for n in range(min(_MAX_WORDS, len(words) - i), 0, -1):
+            run   = words[i:i + n]
+            if any(text[a.end():b.start()].strip() for a, b in zip(run, run[1:])):
+                continue
+            start, end = run[0].start(), run[-1].end()
+            zones = resolve(text[start:end])
+            if zones:
+                mentions.append(Mention(start, end, text[start:end], zones))
+                i += n
+                break
+        else:
+            i += 1
+    return mentions
+
+
+def extract_places(query: Query):
+    # the recognized mentions (source first) plus capitalized word runs the tables do not know
+    places = [mention.text for mention in (query.source, query.target) if mention is not None]
+    places += [mention.text for mention in query.mentions if mention.text not in places]
+    taken  = [(mention.start, mention.end) for mention in query.mentions]
+    for match in re.finditer(r"[A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*", query.text):
+        if match.group() in _FILLER or any(start < match.end() and match.start() < end for start, end in taken):
+            continue
+        places.append(match.group())
+    return places
+
+
+def normalize(query: Query):
+    # canonical form of a request: '2PM CEST in Taiwan' and '14:00 CEST to taiwan time?' both give
+    # '14:00 UTC+02:00 Asia/Taipei'; words outside the recognized spans are kept unless they are stopwords.
+    # Shapes the rules do not model ('in 3 hours', 'between ...') may hinge on any word or number, so
+    # they are keyed on their whole text
+    if not query.supported:
+        return ' '.join(query.text.lower().split())
+    spans = query.spans + [(mention.start, mention.end, '|'.join(map(_canonical, mention.zones)))
+                           for mention in query.mentions]
+    parts = []
+    pos   = 0
+    for start, end, canonical in sorted(spans):
+        parts += query_terms(query.text[pos:start])
+        parts.append(canonical)
+        pos = end
+    parts += query_terms(query.text[pos:])
+    return ' '.join(part for part in parts if part != 'time')
+
+
+def parse_query(text: str) -> Query:
+    query   = Query(text, supported=not _UNSUPPORTED.search(text))
+    taken   = []
+    offsets = []
+    # explicit offsets go first so that 'UTC+5:30' is not read as a time of day
+    for match in _OFFSET.finditer(text):
+        offsets.append(Mention(match.start(), match.end(), match.group(), (_offset_zone(match),)))
+        taken.append(match.span())
+
+    match = _DATE.search(text)
+    if match:
+        if match['iso']:
+            try:
+                query.date = date.fromisoformat(match['iso'])
+            except ValueError:
+                query.supported = False
+        else:
+            query.days = _RELATIVE_DAYS[match['relative'].lower()]
+        query.spans.append((*match.span(), str(query.date) if query.date else f'day{query.days:+d}'))
+        taken.append(match.span())
+
+    times = [match for match in _TIME.finditer(text)
+             if not any(start < match.end() and match.start() < end for start, end in taken)]
+    if len(times) > 1:
+        query.supported = False
+    if times:
+        match = times[0]
+        if match['word']:
+            query.time = time(12) if match['word'].lower() == 'noon' else time(0)
+        else:
+            hour   = int(match['hour'] or match['hour24'])
+            minute = int(match['minute'] or match['minute24'] or 0)
+            valid  = 1 <= hour <= 12 if match['meridiem'] else hour <= 23
+            if match['meridiem']:
+                hour = hour % 12 + (12 if match['meridiem'].lower() == 'p' else 0)
+            if not valid or minute > 59:
+                query.supported = False
+            else:
+                query.time = time(hour, minute)
+                query.spans.append((*match.span(), f'{query.time:%H:%M}'))
+        taken.append(match.span())
+    query.now = bool(_NOW.search(text))
+
+    query.mentions = sorted(offsets + _mentions(text, taken), key=lambda mention: mention.start)
+    if len(query.mentions) > 2:
+        query.supported = False
+        return query
+
+    if query.time is None:
+        if len(query.mentions) == 1:
+            query.target = query.mentions[0]
+        return query
+
+    start, end = times[0].span()
+    for mention in query.mentions:
+        # the source zone is written right next to the time: '2PM CEST', '14:00 in London', 'London 14:00';
+        # the gap is only read on the mention's own side, the slice is empty (and would match) on the other
+        after  = mention.start >= end and re.fullmatch(r'\s*(?:in\s+)?', text[end:mention.start])
+        before = mention.end <= start and re.fullmatch(r'\s*', text[mention.end:start])
+        if after or before or re.search(r'\bfrom\s+$', text[:mention.start], re.I):
+            query.source = mention
+            break
+    others = [mention for mention in query.mentions if mention is not query.source]
+    if query.source is not None and len(others) == 1:
+        query.target = others[0]
+    return query
@@ -0,0 +1,70 @@
+from functools import lru_cache
+
+from .zones import format_offset, zone_index
+
+
+INSTRUCTIONS = '''Convert between time zones based on the zone rows below.
+Elaborate on the countries and time zones that are not included in the rows.
+Do A step-by-step computation of the difference and then reply based on the user request.
+'''
+
+# structured mode: a short JSON reply instead of the step-by-step prose
+STRUCTURED_INSTRUCTIONS = '''Convert between time zones based on the zone rows below.
+Reply with one JSON object and nothing else:
+{"source": "YYYY-MM-DDTHH:MM", "source_zone": "TZ identifier", "target": "YYYY-MM-DDTHH:MM", "target_zone": "TZ identifier"}
+Times are local wall-clock times in their zone. Use null for source and source_zone when the request asks for the current time.
+'''
+
+ROW_HEADER = 'TZ identifier | Country codes | Comment | Type | UTC offset STD | UTC offset DST | Abbreviation STD'
+
+
+def estimate_tokens(text):
+    # about four characters per token for English text and the table rows
+    return (len(text) + 3) // 4
+
+
+@lru_cache(maxsize=1024)
+def render_row(row):
+    index = zone_index()
+    kind  = index.kind[row] + ('†' if index.backzone[row] else '')
+    dst   = format_offset(index.dst[row]) if index.dst[row] != index.std[row] else 'no DST'
+    return ' | '.join((index.name[row], ', '.join(filter(None, index.countries(row))) or '-',
+                       index.comment[row] or '-', kind, format_offset(index.std[row]), dst, index.abbr[row]))
+
+
+class PromptBuilder:
+    '''Builds the model input from the retrieved zone rows instead of a static table.
+
+    The static part (instructions and row header) is what ``Function`` is constructed with;
+    each call only adds the rows of the involved zones, up to ``token_budget`` tokens.
+    '''
+
+    def __init__(self, token_budget: int = 512, cache_static: bool = True, structured: bool = False):
+        self.token_budget = token_budget
+        self.cache_static = cache_static
+        self.structured   = structured
+        self._static      = None
+
+    def static(self):
+        if self._static is not None:
+            return self._static
+        instructions = STRUCTURED_INSTRUCTIONS if self.structured else INSTRUCTIONS
+        static = f'{instructions}\nZone rows have the columns:\n{ROW_HEADER}\n'
+        if self.cache_static:
+            self._static = static
+        return static
+
+    def rows(self, rows):
+        lines  = []
+        budget = self.token_budget
+        for row in dict.fromkeys(rows):
+            line    = render_row(row)
+            budget -= estimate_tokens(line) + 1
+            if budget < 0:
+                break
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def build(self, request, rows, notes=()):
+        notes = ''.join(f'{note}.\n' for note in notes)
+        return f'Zones:\n{self.rows(rows)}\n\n{notes}{request}'
@@ -0,0 +1,206 @@
+import json
+import re
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .parser import Conversion, resolve
+from .zones import abbreviations, parse_offset, zone_index
+
+
+# what the model is asked to reply with in structured mode (see prompt.STRUCTURED_INSTRUCTIONS), and what
+# parse_reply checks replies against; offsets and DST flags are filled in locally
+RESULT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'source':      {'type': ['string', 'null'], 'description': 'local time YYYY-MM-DDTHH:MM, null for the current time'},
+        'source_zone': {'type': ['string', 'null'], 'description': 'TZ identifier or UTC±hh:mm'},
+        'target':      {'type': 'string', 'description': 'local time YYYY-MM-DDTHH:MM'},
+        'target_zone': {'type': 'string', 'description': 'TZ identifier or UTC±hh:mm'},
+    },
+    'required': ['source', 'source_zone', 'target', 'target_zone'],
+    'additionalProperties': False,
+}
+
+_OBJECT = re.compile(r'\{.*\}', re.S)
+_FIXED  = re.compile(r'(?:UTC|GMT)?\s*([+\-−]\d{1,2}(?::?\d{2})?)$', re.I)
+
+
+class ResultError(ValueError):
+    pass
+
+
+@dataclass
+class TimeResult:
+    '''A conversion as data: ISO 8601 instants with their zones, UTC offsets (minutes east) and DST flags.
+
+    ``source`` fields are None for questions about the current time. The DST flag of an abbreviation
+    such as 'CEST' is that of the zones using it, and None for fixed offsets such as 'UTC+05:30'. ``path`` is 'local' or 'llm'; ``verified`` is None unless
+    a model answer was checked against local arithmetic, which lists what did not match in ``issues``.
+    A hybrid-mode reply that could not be read at all keeps its text in ``reply`` and has no times.
+    ``str()`` gives the JSON form.
+    '''
+    source:        Optional[str]
+    source_zone:   Optional[str]
+    source_offset: Optional[int]
+    source_dst:    Optional[bool]
+    target:        str
+    target_zone:   str
+    target_offset: int
+    target_dst:    Optional[bool]
+    path:          str = 'local'
+    cached:        bool = False
+    verified:      Optional[bool] = None
+    issues:        list = field(default_factory=list)
+    reply:         Optional[str] = None
+
+    def __str__(self):
+        return self.to_json()
+
+    def to_json(self):
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text, **changes):
+        values = json.loads(text)
+        values.update(changes)
+        return cls(**{field.name: values[field.name] for field in fields(cls) if field.name in values})
+
+    def moments(self):
+        # the source (None for the current time) and target as aware datetimes in their zones
+        source = _moment(self.source, self.source_zone) if self.source else None
+        return source, _moment(self.target, self.target_zone)
+
+    def to_conversion(self):
+        source, target = self.moments()
+        return Conversion(source, target, self.source_zone, self.target_zone)
+
+    @classmethod
+    def from_moments(cls, source, source_zone, target, target_zone, path='local'):
+        # aware datetimes; source is None for the current time
+        return cls(*_describe(source, source_zone), *_describe(target, target_zone), path)
+
+    @classmethod
+    def from_conversion(cls, conversion, path='local'):
+        return cls.from_moments(conversion.source, conversion.source_zone, conversion.target, conversion.target_zone, path)
+
+    @classmethod
+    def unreadable(cls, reply, issue, path='llm'):
+        # a model reply outside the schema, flagged instead of raised
+        return cls(None, None, None, None, None, None, None, None, path, verified=False, issues=[issue], reply=reply)
+
+
+def _abbreviation_dst(name, minutes):
+    # whether the zones using an abbreviation at this offset observe it as DST ('CEST') or as
+    # standard time ('CET'); None for names that are not abbreviations or are used both ways
+    index = zone_index()
+    rows  = abbreviations().get(name, {}).get(minutes, [])
+    flags = {index.std[row] != minutes for row in rows}
+    return flags.pop() if len(flags) == 1 else None
+
+
+def _describe(moment, zone):
+    if moment is None:
+        return None, None, None, None
+    dst     = moment.dst()
+    minutes = int(moment.utcoffset().total_seconds() // 60)
+    dst     = bool(dst) if dst is not None else _abbreviation_dst(moment.tzname(), minutes)
+    return moment.isoformat(timespec='minutes'), zone, minutes, dst
+
+
+def zone_info(name):
+    '''tzinfo for a TZ identifier, a fixed offset such as 'UTC+05:30' or an unambiguous abbreviation;
+    raises ``ResultError`` otherwise.'''
+    match = _FIXED.match(name.strip())
+    if match:
+        text = match[1].replace('−', '-')
+        if ':' not in text and len(text) > 3:
+            text = f'{text[:-2]}:{text[-2:]}'
+        minutes = parse_offset(text if ':' in text else f'{text}:00')
+        return timezone(timedelta(minutes=minutes), name.strip())
+    try:
+        return ZoneInfo(name.strip())
+    except (ZoneInfoNotFoundError, ValueError):
+        pass
+    # abbreviations and places the parser knows, as long as they name one zone
+    zones = resolve(name.strip())
+    if not zones or len(zones) != 1:
+        raise ResultError(f'unknown or ambiguous time zone {name!r} in the model reply')
+    return zones[0]
+
+
+def _moment(text, zone):
+    try:
+        moment = datetime.fromisoformat(text)
+    except (TypeError, ValueError) as error:
+        raise ResultError(f'invalid time {text!r} in the model reply') from error
+    tz = zone_info(zone)
+    # a local time is read in its zone; an instant with an offset is moved into it
+    return moment.replace(tzinfo=tz) if moment.tzinfo is None else moment.astimezone(tz)
+
+
+_TYPES = {'string': str, 'null': type(None)}
+
+
+def schema_errors(values, schema=RESULT_SCHEMA):
+    '''What in a decoded reply breaks ``schema`` (required and unknown keys, value types); empty when nothing does.'''
+    if not isinstance(values, dict):
+        return ['the reply is not a JSON object']
+    errors = [f'{name!r} is missing' for name in schema['required'] if name not in values]
+    if schema.get('additionalProperties') is False:
+        errors += [f'{name!r} is not in the schema' for name in values if name not in schema['properties']]
+    for name, value in values.items():
+        types = schema['properties'].get(name, {}).get('type')
+        if types is not None and not isinstance(value, tuple(_TYPES[kind] for kind in ([types] if isinstance(types, str) else types))):
+            errors.append(f'{name!r} is not {" or ".join([types] if isinstance(types, str) else types)}')
+    return errors
+
+
+def parse_reply(text, path='llm'):
+    '''The ``TimeResult`` of a model reply that follows ``RESULT_SCHEMA``; raises ``ResultError`` otherwise.'''
+    match = _OBJECT.search(str(text))
+    try:
+        values = json.loads(match.group()) if match else None
+    except json.JSONDecodeError:
+        values = None
+    errors = schema_errors(values)
+    if errors or not values['target'] or not values['target_zone']:
+        raise ResultError(f"the model reply does not follow the result schema ({'; '.join(errors) or 'no target'}): "
+                          f'{str(text)[:200]!r}')
+    source = None
+    if values.get('source') and values.get('source_zone'):
+        source = _moment(values['source'], values['source_zone'])
+    target = _moment(values['target'], values['target_zone'])
+    # places and abbreviations the parser resolved are reported by their TZ identifier
+    return TimeResult.from_moments(source, source and (getattr(source.tzinfo, 'key', None) or values['source_zone']),
+                                   target, getattr(target.tzinfo, 'key', None) or values['target_zone'], path)
+
+
+def _offsets(zones, moment):
+    # the UTC offsets of candidate zones at an instant
+    return {moment.astimezone(zone).utcoffset() for zone in zones}
+
+
+def verify(result, query, now: datetime = None, tolerance: timedelta = timedelta(minutes=15)):
+    '''What in a model ``TimeResult`` disagrees with local arithmetic and the parsed ``query``; empty when nothing does.'''
+    issues = []
+    source, target = result.moments()
+    if source is None:
+        # the model cannot know the current time, a reply far from it is a guess
+        now = now or datetime.now(timezone.utc)
+        if abs(target - now) > tolerance:
+            issues.append(f'{result.target} is not the current time')
+    elif source != target:
+        issues.append(f'{result.source} in {result.source_zone} is {source.astimezone(target.tzinfo).isoformat(timespec="minutes")} '
+                      f'in {result.target_zone}, not {result.target}')
+    if query is None:
+        return issues
+    if source is not None and query.time is not None and source.timetz().replace(tzinfo=None) != query.time:
+        issues.append(f'the source time {source:%H:%M} is not the requested {query.time:%H:%M}')
+    if source is not None and query.date is not None and source.date() != query.date + timedelta(days=query.days):
+        issues.append(f'the source date {source.date()} is not the requested {query.date + timedelta(days=query.days)}')
+    for mention, moment, name in ((query.source, source, 'source'), (query.target, target, 'target')):
+        if mention is not None and moment is not None and moment.utcoffset() not in _offsets(mention.zones, moment):
+            issues.append(f'the {name} zone {getattr(moment.tzinfo, "key", None) or moment.tzname()} does not match {mention.text!r}')
+    return issues
@@ -0,0 +1,200 @@
+import re
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import numpy as np
+
+from .transitions import load_transitions
+from .zones import US_ABBREVIATIONS, format_offset, parse_offset, zone_index
+
+
+# end of the last interval of every zone
+END_OF_TIME = np.iinfo(np.int64).max
+# last year with exact answers; later instants read the offsets in effect at its end
+UNTIL_YEAR  = 2100
+
+# sorted segment boundaries and, per segment, the zones in zones[start[i]:start[i + 1]]
+Segments = namedtuple('Segments', 'boundaries start zones')
+
+_QUESTION = re.compile(r'\bwhich\b.*\bzones?\b', re.I)
+_OFFSET   = re.compile(r'\b(?:UTC|GMT)\s*(?P<offset>[+\-−]\s*\d{1,2}(?::?\d{2})?)(?![\d:])', re.I)
+_ABBR     = re.compile(r'\b(?:use|uses|using|observe|observes|observing|on|in)\s+(?P<abbr>[A-Z]{2,5}|ChST)\b')
+_DATE     = re.compile(r'\b(?P<date>\d{4}-\d{2}-\d{2})(?:[T ](?P<time>\d{1,2}:\d{2}))?\b')
+
+
+def offset_seconds(offset):
+    # seconds east of UTC from seconds, a timedelta or '+05:30'
+    if isinstance(offset, timedelta):
+        return int(offset.total_seconds())
+    if isinstance(offset, str):
+        text = offset.strip().replace(' ', '')
+        if ':' not in text:
+            text = f'{text[:-2]}:{text[-2:]}' if len(text.lstrip('+-−')) > 2 else f'{text}:00'
+        return parse_offset(text) * 60
+    return int(offset)
+
+
+def epoch_seconds(when):
+    # seconds since the epoch from None (now), an aware datetime, datetime64 values or seconds
+    if when is None:
+        return int(time.time())
+    if isinstance(when, datetime):
+        return int(when.timestamp())
+    when = np.asarray(when)
+    if when.dtype.kind == 'M':
+        return when.astype('datetime64[s]').astype(np.int64)
+    return when.astype(np.int64)
+
+
+def build_segments(intervals):
+    # intervals: (starts, ends, zone ids) of half-open [start, end) intervals
+    starts, ends, ids = intervals
+    boundaries = np.unique(np.concatenate((starts, ends)))
+    first  = np.searchsorted(boundaries, starts)
+    counts = np.searchsorted(boundaries, ends) - first
+    # every interval covers the segments first, first + 1, ..., first + count - 1
+    offsets  = np.repeat(np.cumsum(counts) - counts, counts)
+    segments = np.arange(counts.sum()) - offsets + np.repeat(first, counts)
+    zones    = np.repeat(ids, counts)
+    order    = np.argsort(segments, kind='stable')
+    start    = np.concatenate(([0], np.cumsum(np.bincount(segments, minlength=len(boundaries)))))
+    return Segments(boundaries, start, zones[order].astype(np.int32))
+
+
+class ReverseIndex:
+    '''Which zones have a UTC offset or use an abbreviation at an instant.
+
+    For every offset or abbreviation asked about, the transition intervals of all canonical zones with
+    that key are cut into segments at their boundaries, each segment listing the zones in effect
+    (built on first use of the key). A query is one ``searchsorted`` over the boundaries.
+    '''
+
+    def __init__(self, names):
+        self.names       = []
+        self.transitions = []
+        for name in names:
+            try:
+                # segments are cut from the tables as they are, so they are expanded to the end up front
+                self.transitions.append(load_transitions(name, UNTIL_YEAR))
+            except (OSError, ValueError):
+                continue
+            self.names.append(name)
+        self._offsets = {}
+        self._abbrs   = {}
+
+    def _intervals(self, masks):
+        starts, ends, ids = [np.empty(0, np.int64)], [np.empty(0, np.int64)], [np.empty(0, np.int64)]
+        for zone, (transitions, mask) in enumerate(zip(self.transitions, masks)):
+            if mask is None or not mask.any():
+                continue
+            rows = np.flatnonzero(mask)
+            starts.append(transitions.instants[rows])
+            ends.append(np.append(transitions.instants[1:], END_OF_TIME)[rows])
+            ids.append(np.full(len(rows), zone))
+        return np.concatenate(starts), np.concatenate(ends), np.concatenate(ids)
+
+    def offset_segments(self, seconds):
+        if seconds not in self._offsets:
+            self._offsets[seconds] = build_segments(self._intervals(t.offsets == seconds for t in self.transitions))
+        return self._offsets[seconds]
+
+    def abbreviation_segments(self, abbr):
+        if abbr not in self._abbrs:
+            masks = (np.isin(t.abbr, [i for i, name in enumerate(t.abbrs) if name == abbr]) if abbr in t.abbrs else None
+                     for t in self.transitions)
+            self._abbrs[abbr] = build_segments(self._intervals(masks))
+        return self._abbrs[abbr]
+
+    def _lookup(self, segments, instant):
+        segment = np.searchsorted(segments.boundaries, instant, side='right') - 1
+        if segment < 0 or segment >= len(segments.boundaries):
+            return ()
+        return tuple(self.names[zone] for zone in segments.zones[segments.start[segment]:segments.start[segment + 1]])
+
+    def at_offset(self, offset, when=None):
+        '''Zones at ``offset`` (seconds, timedelta or '+05:30') at ``when`` (default now).'''
+        return self._lookup(self.offset_segments(offset_seconds(offset)), epoch_seconds(when))
+
+    def knows(self, abbr):
+        '''Whether any zone ever used the abbreviation ``abbr``.'''
+        return any(abbr in transitions.abbrs for transitions in self.transitions)
+
+    def using(self, abbr, when=None):
+        '''Zones using the abbreviation ``abbr`` at ``when`` (default now).'''
+        return self._lookup(self.abbreviation_segments(abbr), epoch_seconds(when))
+
+    def batch(self, offsets, instants):
+        '''Zones for arrays of offsets (seconds) and instants, as CSR ``(indptr, zone ids)`` into ``names``.
+
+        The zones of query ``i`` are ``[names[z] for z in zones[indptr[i]:indptr[i + 1]]]``; each
+        distinct offset costs one vectorized ``searchsorted``.
+        '''
+        instants = np.atleast_1d(epoch_seconds(instants))
+        offsets  = np.broadcast_to(np.asarray(offsets, np.int64), instants.shape)
+        keys, inverse = np.unique(offsets, return_inverse=True)
+        first  = np.zeros(len(instants), np.int64)
+        counts = np.zeros(len(instants), np.int64)
+        tables = []
+        base   = 0
+        for key, segments in enumerate(self.offset_segments(int(seconds)) for seconds in keys):
+            rows    = np.flatnonzero(inverse == key)
+            segment = np.searchsorted(segments.boundaries, instants[rows], side='right') - 1
+            valid   = segment >= 0
+            first[rows[valid]]  = base + segments.start[segment[valid]]
+            counts[rows[valid]] = segments.start[segment[valid] + 1] - segments.start[segment[valid]]
+            tables.append(segments.zones)
+            base += len(segments.zones)
+        zones  = np.concatenate(tables) if tables else np.empty(0, np.int32)
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        gather = np.arange(indptr[-1]) - np.repeat(indptr[:-1], counts) + np.repeat(first, counts)
+        return indptr, zones[gather]
+
+
+@lru_cache(maxsize=None)
+def reverse_index():
+    index = zone_index()
+    return ReverseIndex([name for row, name in enumerate(index.name) if index.kind[row] == 'Canonical'])
+
+
+def country_zones(code):
+    # zones listed for the ISO country ``code``, in table order
+    index = zone_index()
+    return tuple(dict.fromkeys(index.name[row] for entry, row in enumerate(index.row) if index.country[entry] == code))
+
+
+def answer(text):
+    '''Answer "which zones are at UTC+05:30 now?", "which zones use CST on 2026-07-01?" or
+    "which zones are in AU?", else None.'''
+    if not _QUESTION.search(text):
+        return None
+    date  = _DATE.search(text)
+    when  = None
+    if date:
+        try:
+            when = datetime.fromisoformat(f"{date['date']}T{(date['time'] or '12:00').zfill(5)}")
+        except ValueError:
+            # '2026-02-30' is left to the parser
+            return None
+        when = when.replace(tzinfo=timezone.utc)
+    label = f"on {when:%Y-%m-%d %H:%M} UTC" if when else 'now'
+    match = _OFFSET.search(text)
+    if match:
+        seconds = offset_seconds(match['offset'])
+        zones   = reverse_index().at_offset(seconds, when)
+        subject = f'UTC{format_offset(seconds // 60)}'
+    else:
+        match = _ABBR.search(text)
+        if match is None:
+            return None
+        subject = match['abbr']
+        if not reverse_index().knows(subject):
+            # 'which zones are in AU?' lists the country; 'in CA' may be California and any other
+            # capitalized word is not a question for the index
+            zones = country_zones(subject) if subject not in US_ABBREVIATIONS else ()
+            return f"Time zones in {subject}: {', '.join(zones)}." if zones else None
+        zones   = reverse_index().using(subject, when)
+    if not zones:
+        return f'No time zone is at {subject} {label}.'
+    return f"Time zones at {subject} {label}: {', '.join(zones)}."
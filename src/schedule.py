@@ -0,0 +1,136 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .convert import zone_transitions
+
+
+DAY = 86400
+
+GAP_POLICIES  = ('forward', 'backward', 'skip', 'raise')
+FOLD_POLICIES = ('earlier', 'later', 'skip', 'raise')
+
+WEEKDAYS = (0, 1, 2, 3, 4)
+
+# local ``times`` ('09:00', ...) in ``zone`` on the given weekdays (Monday is 0) or days of the month
+Schedule = namedtuple('Schedule', 'zone times weekdays monthdays', defaults=(range(7), None))
+
+
+class ScheduleError(ValueError):
+    pass
+
+
+def _seconds(value):
+    # '09:00', '09:00:30' or seconds after midnight
+    if isinstance(value, str):
+        parts = [int(part) for part in value.split(':')] + [0, 0]
+        return parts[0] * 3600 + parts[1] * 60 + parts[2]
+    return int(value)
+
+
+def _days(first, last):
+    return np.arange(np.datetime64(first, 'D'), np.datetime64(last, 'D') + 1).astype(np.int64)
+
+
+def _wall_times(schedule, days):
+    weekdays = np.zeros(7, bool)
+    weekdays[list(schedule.weekdays)] = True
+    keep     = weekdays[(days + 3) % 7]                 # 1970-01-01 was a Thursday
+    if schedule.monthdays is not None:
+        monthdays = np.zeros(32, bool)
+        monthdays[list(schedule.monthdays)] = True
+        dates     = days.astype('datetime64[D]')
+        keep     &= monthdays[(dates - dates.astype('datetime64[M]')).astype(np.int64) + 1]
+    times = [schedule.times] if isinstance(schedule.times, (str, int)) else schedule.times
+    times = np.sort(np.array([_seconds(time) for time in times], np.int64))
+    return (days[keep, None] * DAY + times).ravel()
+
+
+def local_occurrences(schedule, first, last):
+    '''Wall-clock seconds since the epoch of every occurrence of ``schedule`` from ``first`` to ``last`` (inclusive).'''
+    return _wall_times(schedule, _days(first, last))
+
+
+def resolve_local(transitions, local, gap='forward', fold='earlier'):
+    '''UTC seconds for wall-clock seconds in one zone, with explicit policies for DST gaps and folds.
+
+    A time in a gap does not exist: ``forward`` reads it with the offset from before the gap (09:30 in a
+    09:00-10:00 gap becomes 10:30, as zoneinfo does), ``backward`` with the one after it (08:30). A time in
+    a fold happens twice: ``earlier`` or ``later`` pick one instant. ``skip`` drops the occurrence and
+    ``raise`` raises ``ScheduleError``. Returns the UTC seconds and the mask of kept occurrences.
+    '''
+    if gap not in GAP_POLICIES or fold not in FOLD_POLICIES:
+        raise ValueError(f'gap must be one of {GAP_POLICIES} and fold one of {FOLD_POLICIES}')
+    # offsets a day before and after; transitions of one zone are always further apart than that
+    before  = transitions.offset_at(local - DAY)
+    after   = transitions.offset_at(local + DAY)
+    early   = local - before
+    late    = local - after
+    valid_early = transitions.offset_at(early) == before
+    valid_late  = transitions.offset_at(late) == after
+    folded  = valid_early & valid_late & (before != after)
+    missing = ~valid_early & ~valid_late
+    utc     = np.where(valid_early, early, late)
+    keep    = np.ones(len(local), bool)
+    for mask, policy, kind in ((missing, gap, 'nonexistent'), (folded, fold, 'ambiguous')):
+        if not mask.any():
+            continue
+        if policy == 'raise':
+            first = np.datetime64(int(local[mask][0]), 's')
+            raise ScheduleError(f'{first} is {kind} in {transitions.name}')
+        if policy == 'skip':
+            keep &= ~mask
+        elif policy in ('forward', 'later'):
+            utc = np.where(mask, np.maximum(early, late), utc)
+        else:
+            utc = np.where(mask, np.minimum(early, late), utc)
+    return utc, keep
+
+
+def expand(schedule, first, last, to_zone=None, gap='forward', fold='earlier'):
+    '''All occurrences of ``schedule`` between two dates as UTC ``datetime64[s]``.
+
+    With ``to_zone`` the occurrences are returned as wall-clock times in that zone instead.
+    '''
+    local     = local_occurrences(schedule, first, last)
+    utc, keep = resolve_local(zone_transitions(schedule.zone), local, gap, fold)
+    utc       = utc[keep]
+    if to_zone is not None:
+        utc = zone_transitions(to_zone).to_local(utc)
+    return utc.astype('datetime64[s]')
+
+
+def iter_expand(schedule, first, last, to_zone=None, gap='forward', fold='earlier', chunk_days: int = 366):
+    '''``expand`` in chunks of ``chunk_days`` days, for horizons too long to hold at once.'''
+    start = np.datetime64(first, 'D')
+    last  = np.datetime64(last, 'D')
+    while start <= last:
+        end = min(start + chunk_days - 1, last)
+        yield expand(schedule, start, end, to_zone, gap, fold)
+        start = end + 1
+
+
+def expand_many(schedules, first, last, to_zone=None, gap='forward', fold='earlier'):
+    '''Occurrences of many schedules as ``(indptr, occurrences)``.
+
+    The occurrences of ``schedules[i]`` are ``occurrences[indptr[i]:indptr[i + 1]]``. Schedules in the same
+    zone are resolved together, one ``searchsorted`` pass per zone.
+    '''
+    days       = _days(first, last)
+    wall_times = [_wall_times(schedule, days) for schedule in schedules]
+    owner      = np.repeat(np.arange(len(schedules)), [len(local) for local in wall_times])
+    local      = np.concatenate(wall_times) if wall_times else np.empty(0, np.int64)
+    utc        = np.empty_like(local)
+    keep       = np.ones(len(local), bool)
+    names, zone_of = np.unique([schedule.zone for schedule in schedules], return_inverse=True)
+    # rows grouped by zone, in the way convert_many groups timestamps
+    order  = np.argsort(zone_of[owner], kind='stable')
+    bounds = np.cumsum(np.bincount(zone_of[owner], minlength=len(names)))
+    for name, start, end in zip(names, np.concatenate(([0], bounds[:-1])), bounds):
+        rows = order[start:end]
+        utc[rows], keep[rows] = resolve_local(zone_transitions(str(name)), local[rows], gap, fold)
+    utc, owner = utc[keep], owner[keep]
+    if to_zone is not None:
+        utc = zone_transitions(to_zone).to_local(utc)
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(owner, minlength=len(schedules)))))
+    return indptr, utc.astype('datetime64[s]')
@@ -0,0 +1,131 @@
+import re
+from array import array
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from heapq import nlargest
+from math import log, sqrt
+
+from .zones import zone_index
+
+
+# words that collide with ISO codes or abbreviations ('in', 'is', 'at', 'it', ...) unless written in capitals
+STOPWORDS = frozenset('''
+a am an and are as at be by convert do does for from get give hour hours how in into is it
+me my now of on or pm please right show tell the then this time times to what when where which zone zones
+'''.split())
+
+_WORD = re.compile(r'[^\W_]+')
+
+
+def query_terms(text):
+    terms = []
+    for word in _WORD.findall(text):
+        lower = word.lower()
+        if lower in STOPWORDS and not word.isupper():
+            continue
+        if lower.isdigit():
+            continue
+        terms.append(lower)
+    return terms
+
+
+def trigrams(term):
+    padded = f' {term} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@lru_cache(maxsize=1 << 16)
+def similarity(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def row_fields(index, row):
+    name = index.name[row]
+    fields = [name.lower(), name.rsplit('/', 1)[-1].replace('_', ' ').lower(), index.abbr[row].lower()]
+    fields.extend(code.lower() for code in index.countries(row) if code)
+    if index.comment[row]:
+        fields.append(index.comment[row].lower())
+    return fields
+
+
+class TrigramIndex:
+    '''Character trigram inverted index over zone identifiers, comments, country codes and abbreviations.
+
+    Candidates are gathered from the posting lists of the query trigrams and scored with idf weights;
+    only the best ``shortlist`` candidates are rescored with ``SequenceMatcher`` against the row fields.
+    '''
+
+    def __init__(self, index):
+        self.index    = index
+        self.terms    = [sorted({term for field in row_fields(index, row) for term in query_terms(field) or [field]})
+                         for row in range(len(index))]
+        self.grams    = {}
+        postings      = defaultdict(set)
+        for row, terms in enumerate(self.terms):
+            for term in terms:
+                grams = self.grams.setdefault(term, frozenset(trigrams(term)))
+                for gram in grams:
+                    postings[gram].add(row)
+        self.postings = {gram: array('H', sorted(rows)) for gram, rows in postings.items()}
+        # squared idf, the weight a shared trigram adds to the dot product
+        self.weight   = {gram: log(1 + len(index) / len(rows)) ** 2 for gram, rows in self.postings.items()}
+        norms         = [0.0] * len(index)
+        for gram, rows in self.postings.items():
+            for row in rows:
+                norms[row] += self.weight[gram]
+        self.norm     = array('d', (sqrt(norm) or 1.0 for norm in norms))
+
+    def candidates(self, terms):
+        grams = set()
+        for term in terms:
+            grams |= trigrams(term)
+        scores = defaultdict(float)
+        query_norm = 0.0
+        for gram in grams:
+            weight = self.weight.get(gram)
+            if weight is None:
+                continue
+            query_norm += weight
+            for row in self.postings[gram]:
+                scores[row] += weight
+        query_norm = sqrt(query_norm) or 1.0
+        return {row: score / (query_norm * self.norm[row]) for row, score in scores.items()}
+
+    def rescore(self, terms, row):
+        best = 0.0
+        for query, grams in terms:
+            for term in self.terms[row]:
+                # pairs without a common trigram cannot beat the candidates that have one
+                if not grams.isdisjoint(self.grams[term]):
+                    best = max(best, similarity(query, term))
+        return best
+
+    def search(self, query, k=10, shortlist=None):
+        terms = query_terms(query)
+        if not terms:
+            return []
+        scores = self.candidates(terms)
+        shortlist = nlargest(shortlist or 2 * k, scores, key=scores.get)
+        terms = [(term, trigrams(term)) for term in terms]
+        ranked = {row: (self.rescore(terms, row) + scores[row]) / 2 for row in shortlist}
+        return [(row, ranked[row]) for row in nlargest(k, ranked, key=ranked.get)]
+
+
+def adaptive_cut(ranked, min_score: float = 0.45, gap: float = 0.2):
+    '''The head of a best-first ``[(row, score)]`` ranking, so a clear winner is sent alone.
+
+    Rows stop at the first score below ``min_score`` or at least ``gap`` below the one before it;
+    the best row is always kept.
+    '''
+    kept = ranked[:1]
+    for (_, previous), (row, score) in zip(ranked, ranked[1:]):
+        if score < min_score or previous - score >= gap:
+            break
+        kept.append((row, score))
+    return kept
+
+
+@lru_cache(maxsize=None)
+def trigram_index():
+    return TrigramIndex(zone_index())
@@ -0,0 +1,172 @@
+'''Resident server that keeps the zone index, caches and the model client warm.
+
+    python -m src.server --socket /tmp/timezone.sock     # or --port 8765 [--host 127.0.0.1]
+
+Clients send one JSON object per line, ``{"query": "...", "k": 10}``, and get
+``{"answer": "...", "path": "local", "cached": false}`` back on the same connection; ``{"command": "stats"}``
+returns the pipeline stats and ``{"command": "ping"}`` checks liveness. Requests may carry the pipeline options
+of ``TimezoneCore`` (``"local"``, ``"extraction"``, ``"token_budget"``, ``"min_score"``, ...); with ``"structured": true``
+the answer is the JSON of a ``TimeResult``. With ``TIMEZONE_SERVER`` set to the socket path or ``host:port``,
+``Timezone`` and ``python -m src.cli`` forward their requests, with their options, to the server.
+SIGHUP reloads the zone data (after ``python -m src.build`` or a tzdata update) without dropping requests;
+SIGTERM and SIGINT stop accepting connections and finish the requests in flight.
+'''
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+
+from . import artifact, exact, gazetteer, prompt, search, transitions, zones
+from .cache import ResponseCache
+from .client import parse_address
+from .core import REMOTE_OPTIONS, TimezoneCore
+from .stats import PipelineStats
+
+
+def clear_data():
+    # drop everything derived from the zone data so that it is read again on next use
+    for cached in (artifact.artifact, zones.zone_index, zones.country_names, zones.abbreviations,
+                   search.trigram_index, search.similarity, gazetteer.places, gazetteer.place_index, prompt.render_row,
+                   transitions.transition_store, exact.exact_index):
+        cached.cache_clear()
+    if 'src.convert' in sys.modules:
+        sys.modules['src.convert'].zone_key.cache_clear()
+    if 'src.reverse' in sys.modules:
+        sys.modules['src.reverse'].reverse_index.cache_clear()
+
+
+def warm(pipeline, model: bool = False):
+    # build the indexes (and the model Function) before the first request needs them
+    zones.zone_index(), zones.abbreviations(), search.trigram_index(), gazetteer.place_index(), exact.exact_index()
+    # the warm-up query is planned without a model call, and is not one of the requests served
+    stats, pipeline.stats = pipeline.stats, None
+    try:
+        pipeline.plan('What is 12:00 UTC in Tokyo?')
+    finally:
+        pipeline.stats = stats
+    if model:
+        pipeline.fn
+
+
+class Server:
+    def __init__(self, address, cache_size: int = 4096, warm_model: bool = False, grace: float = 10.0, **options):
+        self.address    = address
+        # seconds that connections still open at shutdown get to finish their requests
+        self.grace      = grace
+        self.cache_size = cache_size
+        self.warm_model = warm_model
+        self.options    = options
+        self.stats      = PipelineStats()
+        self.pipeline   = self.create()
+        self.variants   = {}
+        self._requests  = set()
+        self._stopped   = None
+
+    def create(self, **options):
+        pipeline = TimezoneCore(cache=ResponseCache(self.cache_size), stats=self.stats, server='',
+                                **{**self.options, **options})
+        warm(pipeline, self.warm_model)
+        return pipeline
+
+    def reload(self):
+        # requests in flight keep the pipeline they started with
+        clear_data()
+        self.pipeline   = self.create()
+        self.variants   = {}
+
+    def pipeline_for(self, **options):
+        # requests with other options than the server's come from pipelines of their own, built on the first
+        # request for one
+        defaults = {name: getattr(self.pipeline, name) for name in REMOTE_OPTIONS}
+        options  = {**defaults, **options}
+        if options == defaults:
+            return self.pipeline
+        key = tuple(sorted(options.items()))
+        if key not in self.variants:
+            self.variants[key] = self.create(**options)
+        return self.variants[key]
+
+    async def respond(self, message):
+        command = message.get('command', 'query')
+        if command == 'ping':
+            return {'ok': True}
+        if command == 'stats':
+            return self.stats.snapshot()
+        if command != 'query':
+            raise ValueError(f'unknown command {command!r}')
+        if str(message['query']).lstrip().startswith('--'):
+            # command-line options such as --stream read and write files; the server only answers questions
+            raise ValueError('queries starting with -- are not accepted')
+        pipeline = self.pipeline_for(**{name: message[name] for name in REMOTE_OPTIONS if name in message})
+        answer   = await pipeline.aforward(message['query'], int(message.get('k', 10)))
+        return {'answer': str(answer), 'path': answer.path, 'cached': answer.cached}
+
+    async def handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._requests.add(task)
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.respond(json.loads(line))
+                except Exception as error:
+                    response = {'error': f'{type(error).__name__}: {error}'}
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._requests.discard(task)
+            writer.close()
+
+    async def serve(self):
+        family, target = parse_address(self.address)
+        if family == 'unix':
+            if os.path.exists(target):
+                os.unlink(target)
+            server = await asyncio.start_unix_server(self.handle, target)
+        else:
+            server = await asyncio.start_server(self.handle, *target)
+        loop          = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        loop.add_signal_handler(signal.SIGHUP, self.reload)
+        for stop in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(stop, self._stopped.set)
+        print(f'serving on {self.address}', file=sys.stderr, flush=True)
+        async with server:
+            await self._stopped.wait()
+            server.close()
+            if self._requests:
+                _, idle = await asyncio.wait(self._requests, timeout=self.grace)
+                for task in idle:
+                    task.cancel()
+        if family == 'unix' and os.path.exists(target):
+            os.unlink(target)
+
+    def stop(self):
+        if self._stopped is not None:
+            self._stopped.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.server', description=__doc__.splitlines()[0])
+    where  = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument('--socket', help='Unix socket path')
+    where.add_argument('--port', type=int, help='TCP port on --host')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--cache-size', type=int, default=4096)
+    parser.add_argument('--warm-model', action='store_true', help='build the model Function at startup')
+    parser.add_argument('--no-local', action='store_true', help='send every query to the model')
+    parser.add_argument('--extraction', choices=('local', 'llm', 'fold'), default='local')
+    parser.add_argument('--token-budget', type=int, default=512)
+    args    = parser.parse_args(argv)
+    address = args.socket or f'{args.host}:{args.port}'
+    server  = Server(address, args.cache_size, args.warm_model, local=not args.no_local,
+                     extraction=args.extraction, token_budget=args.token_budget)
+    asyncio.run(server.serve())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
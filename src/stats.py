@@ -0,0 +1,92 @@
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+
+# upper bounds of the latency buckets in seconds: 1µs, 2µs, 4µs, ... about 1100s
+BUCKETS = tuple(1e-6 * 2 ** i for i in range(31))
+
+
+class Histogram:
+    '''Latency histogram with power-of-two buckets; percentiles are reported as bucket upper bounds.'''
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count  = 0
+        self.total  = 0.0
+        self.min    = float('inf')
+        self.max    = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min    = min(self.min, seconds)
+        self.max    = max(self.max, seconds)
+
+    def percentile(self, fraction):
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(BUCKETS[bucket], self.max) if bucket < len(BUCKETS) else self.max
+        return 0.0
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return {'count': self.count, 'mean': self.total / self.count, 'min': self.min, 'max': self.max,
+                'p50': self.percentile(0.5), 'p90': self.percentile(0.9), 'p99': self.percentile(0.99)}
+
+
+class PipelineStats:
+    '''In-process counters of the Timezone pipeline.
+
+    Stages are 'parse', 'local', 'cache', 'extract', 'retrieve', 'prompt', 'model' and 'total' (one
+    ``forward``); each gets a latency histogram. Hooks are called as ``hook(stage, seconds, info)`` after
+    every stage, ``info`` being a dict with stage details such as the tokens of a model call.
+    Pass no stats object to the pipeline to skip all timing.
+    '''
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.stages       = defaultdict(Histogram)
+            self.paths        = Counter()
+            self.tokens_in    = 0
+            self.tokens_out   = 0
+            self.cache_hits   = 0
+            self.cache_misses = 0
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def record(self, stage, seconds, **info):
+        with self._lock:
+            self.stages[stage].add(seconds)
+            if stage == 'cache':
+                if info.get('hit'):
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+            elif stage == 'model':
+                self.tokens_in  += info.get('tokens_in', 0)
+                self.tokens_out += info.get('tokens_out', 0)
+        for hook in self.hooks:
+            hook(stage, seconds, info)
+
+    def answered(self, path, cached=False):
+        # 'local', 'llm' or 'llm (cached)'
+        with self._lock:
+            self.paths[path + (' (cached)' if cached else '')] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {'stages': {stage: histogram.summary() for stage, histogram in self.stages.items()},
+                    'paths': dict(self.paths), 'tokens_in': self.tokens_in, 'tokens_out': self.tokens_out,
+                    'cache_hits': self.cache_hits, 'cache_misses': self.cache_misses}
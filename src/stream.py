@@ -0,0 +1,191 @@
+import argparse
+import csv
+import json
+import re
+import sys
+from collections import Counter
+from itertools import islice
+
+import numpy as np
+
+from .convert import convert_many, zone_key
+
+
+_OFFSET_SUFFIX = re.compile(r'(?:Z|[+-]\d{2}:?\d{2})$')
+
+
+def _parse_timestamp(value):
+    try:
+        return np.datetime64(value)
+    except ValueError:
+        return np.datetime64('NaT')
+
+
+def parse_timestamps(values):
+    # ISO 8601 strings; a trailing 'Z' or '+hh:mm' makes the value an absolute instant, which is
+    # returned as UTC wall-clock time together with a mask of the rows it applies to
+    naive   = []
+    offsets = np.zeros(len(values), np.int64)
+    aware   = np.zeros(len(values), bool)
+    for i, value in enumerate(values):
+        value = (value or '').strip()
+        match = _OFFSET_SUFFIX.search(value) if len(value) > 10 else None
+        if match:
+            suffix = match.group()
+            aware[i] = True
+            if suffix != 'Z':
+                sign = -1 if suffix[0] == '-' else 1
+                offsets[i] = sign * (int(suffix[1:3]) * 3600 + int(suffix[-2:]) * 60)
+            value = value[:match.start()]
+        naive.append(value or 'NaT')
+    try:
+        timestamps = np.array(naive, dtype='datetime64')
+    except ValueError:
+        # one unparseable value fails the whole chunk; read them one by one and leave the bad ones NaT
+        timestamps = np.array([_parse_timestamp(value) for value in naive], dtype='datetime64')
+    if np.datetime_data(timestamps.dtype)[0] in ('generic', 'D', 'h', 'm'):
+        timestamps = timestamps.astype('datetime64[s]')
+    return timestamps - offsets.astype('timedelta64[s]'), aware
+
+
+def format_timestamps(timestamps):
+    return ['' if value == 'NaT' else value for value in np.datetime_as_string(timestamps)]
+
+
+def _known_zones(names, unknown):
+    # zones of a column with the ones that cannot be read ('', 'Mars/Base', 'CST') replaced by 'UTC', the mask
+    # of their rows, and their row counts added to ``unknown``
+    bad = np.zeros(len(names), bool)
+    for name in np.unique(names):
+        try:
+            zone_key(str(name))
+        except ValueError:
+            rows = names == name
+            bad |= rows
+            unknown[str(name)] += int(rows.sum())
+    return (np.where(bad, 'UTC', names) if bad.any() else names), bad
+
+
+def convert_rows(rows, columns, from_zone=None, to_zone=None, from_column=None, to_column=None, suffix='',
+                 unknown=None):
+    # converts the named columns of a chunk of dict rows in place (or into '<column><suffix>'); rows whose
+    # zone column cannot be read are written empty and counted per zone in ``unknown``
+    unknown = Counter() if unknown is None else unknown
+    bad     = np.zeros(len(rows), bool)
+    sources, targets = from_zone, to_zone
+    if from_column:
+        sources, bad_sources = _known_zones(np.array([str(row.get(from_column) or '') for row in rows]), unknown)
+        bad |= bad_sources
+    if to_column:
+        targets, bad_targets = _known_zones(np.array([str(row.get(to_column) or '') for row in rows]), unknown)
+        bad |= bad_targets
+    for column in columns:
+        timestamps, aware = parse_timestamps([row.get(column) for row in rows])
+        if aware.any():
+            row_sources = np.where(aware, 'UTC', sources).astype(str)
+        else:
+            row_sources = sources
+        converted = convert_many(timestamps, row_sources, targets)
+        converted[bad] = np.datetime64('NaT')
+        for row, value in zip(rows, format_timestamps(converted)):
+            row[column + suffix] = value
+    return rows
+
+
+def _convert_chunk(job):
+    rows, columns, options = job
+    unknown = Counter()
+    return convert_rows(rows, columns, unknown=unknown, **options), unknown
+
+
+def _converted(chunks, columns, options, workers):
+    # (converted chunk, unknown zones) in input order, from worker processes when there is more than one
+    if not workers or workers == 1:
+        for chunk in chunks:
+            yield _convert_chunk((chunk, columns, options))
+        return
+    from .parallel import ShardedPool
+    with ShardedPool(workers) as pool:
+        yield from pool.map(_convert_chunk, ((chunk, columns, options) for chunk in chunks))
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def convert_stream(source, sink, columns, from_zone=None, to_zone=None, from_column=None, to_column=None,
+                   format='csv', chunk_size=10000, suffix='', workers=None, unknown=None):
+    '''Convert timestamp columns of a CSV or JSONL stream chunk by chunk.
+
+    Memory stays bounded by ``chunk_size`` rows; every chunk is written and flushed before the next
+    one is read. Zones come from ``from_zone``/``to_zone`` or per row from ``from_column``/``to_column``.
+    With ``workers`` the chunks are converted in that many processes, a few chunks each at a time,
+    and still written in order. Values that are not timestamps, and rows whose zone column holds no zone
+    that can be read, are written empty; the latter are counted per zone in the ``unknown`` Counter when
+    one is given. Returns the number of rows written.
+    '''
+    if (from_zone is None) == (from_column is None) or (to_zone is None) == (to_column is None):
+        raise ValueError('give exactly one of from_zone/from_column and one of to_zone/to_column')
+    options = dict(from_zone=from_zone, to_zone=to_zone, from_column=from_column, to_column=to_column, suffix=suffix)
+    count   = 0
+    unknown = Counter() if unknown is None else unknown
+    if format == 'jsonl':
+        rows = (json.loads(line) for line in source if line.strip())
+        for chunk, chunk_unknown in _converted(_chunks(rows, chunk_size), columns, options, workers):
+            unknown.update(chunk_unknown)
+            sink.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in chunk))
+            sink.flush()
+            count += len(chunk)
+        return count
+    if format != 'csv':
+        raise ValueError(f'unsupported format {format!r}')
+    reader = csv.DictReader(source)
+    fields = list(reader.fieldnames or [])
+    fields += [column + suffix for column in columns if column + suffix not in fields]
+    writer = csv.DictWriter(sink, fields, extrasaction='ignore')
+    writer.writeheader()
+    for chunk, chunk_unknown in _converted(_chunks(reader, chunk_size), columns, options, workers):
+        unknown.update(chunk_unknown)
+        writer.writerows(chunk)
+        sink.flush()
+        count += len(chunk)
+    return count
+
+
+def main(argv=None, stdin=None, stdout=None):
+    parser = argparse.ArgumentParser(prog='timezone --stream', description='Convert timestamp columns of CSV or JSONL data.')
+    parser.add_argument('--stream', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('input', nargs='?', default='-', help='input file, - for stdin')
+    parser.add_argument('-o', '--output', default='-', help='output file, - for stdout')
+    parser.add_argument('-c', '--columns', required=True, help='comma-separated timestamp columns')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--from', dest='from_zone', help='zone of the input timestamps')
+    source.add_argument('--from-column', help='column holding the zone of each row')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--to', dest='to_zone', help='zone to convert to')
+    target.add_argument('--to-column', help='column holding the target zone of each row')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='defaults to the input file extension, else csv')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--suffix', default='', help='write to <column><suffix> instead of in place')
+    parser.add_argument('--workers', type=int, help='convert chunks in this many processes')
+    args = parser.parse_args(argv)
+
+    format = args.format or ('jsonl' if args.input.endswith(('.jsonl', '.ndjson')) else 'csv')
+    source = (stdin or sys.stdin) if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    sink   = (stdout or sys.stdout) if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    unknown = Counter()
+    try:
+        return convert_stream(source, sink, args.columns.split(','), args.from_zone, args.to_zone, args.from_column,
+                              args.to_column, format, args.chunk_size, args.suffix, args.workers, unknown)
+    finally:
+        for name, rows in unknown.most_common():
+            print(f'Unknown or ambiguous zone {name!r} in {rows} rows, written empty.', file=sys.stderr)
+        for f in (source, sink):
+            if f not in (stdin, stdout, sys.stdin, sys.stdout):
+                f.close()
+
+
+if __name__ == '__main__':
+    main()
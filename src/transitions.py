@@ -0,0 +1,330 @@
+import calendar
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+
+import numpy as np
+
+from .artifact import artifact
+from .zones import tzdata_file
+
+
+# start of the first interval, before the first transition of every zone
+BIG_BANG = np.iinfo(np.int64).min
+DAY      = 86400
+# footer rules are expanded at least this many years at a time
+STEP     = 8
+MAX_YEAR = 9999
+
+_POSIX_NAME   = r'(?:<[^>]+>|[A-Za-z]{3,})'
+_POSIX_OFFSET = r'[+-]?\d{1,3}(?::\d{2}){0,2}'
+_POSIX_RULE   = r'(?:M\d{1,2}\.\d\.\d|J\d{1,3}|\d{1,3})(?:/[+-]?\d{1,3}(?::\d{2}){0,2})?'
+_POSIX_TZ     = re.compile(rf'(?P<std>{_POSIX_NAME})(?P<std_offset>{_POSIX_OFFSET})'
+                           rf'(?:(?P<dst>{_POSIX_NAME})(?P<dst_offset>{_POSIX_OFFSET})?'
+                           rf',(?P<start>{_POSIX_RULE}),(?P<end>{_POSIX_RULE}))?$')
+
+
+class ZoneTransitions:
+    '''UTC-offset history of one zone as parallel NumPy arrays.
+
+    Interval ``i`` starts at ``instants[i]`` (seconds since the epoch, UTC) and has the offset
+    ``offsets[i]`` (seconds east of UTC), the DST flag ``isdst[i]`` and the abbreviation
+    ``abbrs[abbr[i]]``; the first interval starts at ``BIG_BANG``.
+
+    Transitions after the last explicit one come from the POSIX ``footer`` rule and are only
+    materialized up to the latest year asked about: ``until`` is the first year not expanded yet,
+    None when the table is complete. ``on_grow`` is called with the table after it was extended.
+    '''
+
+    def __init__(self, name, instants, offsets, isdst, abbr, abbrs, footer=None, until=None):
+        self.name     = name
+        self.instants = instants
+        self.offsets  = offsets
+        self.isdst    = isdst
+        self.abbr     = abbr
+        self.abbrs    = abbrs
+        self.footer   = footer
+        self.until    = until
+        self.on_grow  = None
+        self._local_starts = None
+        self._lock    = threading.Lock()
+
+    def __len__(self):
+        return len(self.instants)
+
+    @property
+    def nbytes(self):
+        # memory owned by the arrays; views into the artifact mapping are shared and cost nothing
+        return sum(values.nbytes for values in (self.instants, self.offsets, self.isdst, self.abbr) if values.flags.owndata)
+
+    def extend(self, last_year):
+        '''Materialize the footer rule up to the end of ``last_year``.'''
+        if self.until is None or last_year < self.until:
+            return
+        with self._lock:
+            if self.until is None or last_year < self.until:
+                return
+            grown = False
+            last_year = min(max(last_year, self.until + STEP - 1), MAX_YEAR)
+            extra     = posix_transitions(self.footer, self.until, last_year)
+            if extra and extra[0]:
+                keep = np.array(extra[0], np.int64) > self.instants[-1]
+                abbrs = list(self.abbrs)
+                for name in extra[3]:
+                    if name not in abbrs:
+                        abbrs.append(name)
+                abbr = np.array([abbrs.index(name) for name in extra[3]], np.int16)[keep]
+                # readers may hold the old arrays; every array is replaced, none is changed in place
+                self.offsets  = np.concatenate((self.offsets, np.array(extra[1], np.int32)[keep]))
+                self.isdst    = np.concatenate((self.isdst, np.array(extra[2], np.int8)[keep]))
+                self.abbr     = np.concatenate((self.abbr, abbr))
+                self.abbrs    = abbrs
+                self._local_starts = None
+                self.instants = np.concatenate((self.instants, np.array(extra[0], np.int64)[keep]))
+                grown = True
+            self.until = last_year + 1 if last_year < MAX_YEAR else None
+        if grown and self.on_grow is not None:
+            self.on_grow(self)
+
+    def cover(self, seconds):
+        # make sure the table reaches the latest of the given UTC or wall-clock seconds
+        if self.until is None or np.size(seconds) == 0:
+            return
+        latest = int(np.max(seconds))
+        if latest >= calendar.timegm((min(self.until, MAX_YEAR), 1, 1, 0, 0, 0)) - DAY:
+            # a day of slack for wall-clock times ahead of UTC
+            self.extend(datetime.fromtimestamp(min(latest, 253402214400) + DAY, timezone.utc).year)
+
+    def interval(self, utc):
+        self.cover(utc)
+        return np.searchsorted(self.instants, utc, side='right') - 1
+
+    def offset_at(self, utc):
+        # the interval first, it may extend the arrays
+        interval = self.interval(utc)
+        return self.offsets[interval]
+
+    def to_local(self, utc):
+        return utc + self.offset_at(utc)
+
+    def to_utc(self, local):
+        # wall-clock time at which interval i starts to apply: the later reading of the transition instant,
+        # so that ambiguous (folded) times take the earlier instant and times in a gap are read with the
+        # offset from before the gap, which shifts them forward, as zoneinfo does with fold=0
+        self.cover(local)
+        # another thread may extend the table meanwhile; its offsets are replaced first, so they are never shorter
+        instants, offsets, starts = self.instants, self.offsets, self._local_starts
+        offsets = offsets[:len(instants)]
+        if starts is None or len(starts) != len(instants):
+            starts = np.concatenate(([BIG_BANG], instants[1:] + np.maximum(offsets[:-1], offsets[1:])))
+            self._local_starts = starts
+        return local - offsets[np.searchsorted(starts, local, side='right') - 1]
+
+
+def fixed(name, seconds):
+    return ZoneTransitions(name, np.array([BIG_BANG], np.int64), np.array([seconds], np.int32),
+                           np.zeros(1, np.int8), np.zeros(1, np.int16), [name])
+
+
+def _parse_posix_offset(text):
+    # POSIX offsets count west of UTC; the result counts east
+    sign = -1 if text.startswith('-') else 1
+    parts = [int(part) for part in text.lstrip('+-').split(':')] + [0, 0]
+    return -sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _parse_rule_time(text):
+    sign = -1 if text.startswith('-') else 1
+    parts = [int(part) for part in text.lstrip('+-').split(':')] + [0, 0]
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _rule_day(rule, year):
+    # seconds from the epoch to local midnight of the day a POSIX rule selects in ``year``
+    if rule.startswith('M'):
+        month, week, weekday = (int(part) for part in rule[1:].split('.'))
+        first = (calendar.weekday(year, month, 1) + 1) % 7        # 0 = Sunday, as in POSIX
+        day   = 1 + (weekday - first) % 7 + 7 * (week - 1)
+        while day > calendar.monthrange(year, month)[1]:
+            day -= 7
+        return calendar.timegm((year, month, day, 0, 0, 0))
+    start = calendar.timegm((year, 1, 1, 0, 0, 0))
+    if rule.startswith('J'):
+        # 1-based day of the year, February 29th is never counted
+        day = int(rule[1:]) - 1
+        if calendar.isleap(year) and day >= 59:
+            day += 1
+        return start + day * DAY
+    return start + int(rule) * DAY
+
+
+def posix_transitions(footer, first_year, last_year):
+    '''Transitions of a POSIX TZ string such as ``CET-1CEST,M3.5.0,M10.5.0/3`` between two years.
+
+    Returns (instants, offsets, isdst, names) for each transition, or None for unparseable strings.
+    '''
+    match = _POSIX_TZ.match(footer)
+    if match is None:
+        return None
+    std        = match['std'].strip('<>')
+    std_offset = _parse_posix_offset(match['std_offset'])
+    if not match['dst']:
+        return [], [], [], []
+    dst        = match['dst'].strip('<>')
+    dst_offset = _parse_posix_offset(match['dst_offset']) if match['dst_offset'] else std_offset + 3600
+    rules      = []
+    for rule, offset_before, offset, isdst, name in ((match['start'], std_offset, dst_offset, 1, dst),
+                                                     (match['end'], dst_offset, std_offset, 0, std)):
+        day, _, at = rule.partition('/')
+        rules.append((day, _parse_rule_time(at) if at else 7200, offset_before, offset, isdst, name))
+    events = []
+    for year in range(first_year, last_year + 1):
+        for day, at, offset_before, offset, isdst, name in rules:
+            # rule times are local wall-clock times in the offset that is ending
+            events.append((_rule_day(day, year) + at - offset_before, offset, isdst, name))
+    events.sort()
+    return ([event[0] for event in events], [event[1] for event in events],
+            [event[2] for event in events], [event[3] for event in events])
+
+
+def read_tzif(name, data, until_year=None):
+    if data[:4] != b'TZif':
+        raise ValueError(f'{name!r} is not a TZif file')
+    version = data[4:5]
+
+    def header(offset):
+        return [int(count) for count in np.frombuffer(data, '>u4', 6, offset + 20)]
+
+    isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = header(0)
+    width  = 4
+    offset = 44
+    if version >= b'2':
+        # skip the 32-bit block, the 64-bit one follows with its own header
+        offset += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+        isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = header(offset)
+        width   = 8
+        offset += 44
+    times   = np.frombuffer(data, f'>i{width}', timecnt, offset).astype(np.int64)
+    offset += timecnt * width
+    indices = np.frombuffer(data, np.uint8, timecnt, offset).astype(np.int64)
+    offset += timecnt
+    types   = np.frombuffer(data, np.dtype([('utoff', '>i4'), ('isdst', 'u1'), ('desig', 'u1')]), typecnt, offset)
+    offset += typecnt * 6
+    chars   = data[offset:offset + charcnt]
+    offset += charcnt + leapcnt * (width + 4) + isstdcnt + isutcnt
+    footer  = data[offset:].strip(b'\n').decode('ascii') if version >= b'2' else ''
+
+    names    = [chars[start:chars.index(b'\0', start)].decode('ascii') for start in types['desig']]
+    abbrs    = list(dict.fromkeys(names))
+    abbr_of  = np.array([abbrs.index(name) for name in names], np.int16)
+    instants = np.concatenate(([BIG_BANG], times))
+    kinds    = np.concatenate(([0], indices))
+    offsets  = types['utoff'].astype(np.int32)[kinds]
+    isdst    = types['isdst'].astype(np.int8)[kinds]
+    abbr     = abbr_of[kinds]
+
+    # the footer describes the rules after the last explicit transition; only rules with DST add any
+    footer = footer if footer and _POSIX_TZ.match(footer) and _POSIX_TZ.match(footer)['dst'] else None
+    first  = datetime.fromtimestamp(max(times[-1] if timecnt else 0, 0), timezone.utc).year
+    transitions = ZoneTransitions(name, instants, offsets, isdst, abbr, abbrs, footer, first if footer else None)
+    transitions.extend(until_year or datetime.now(timezone.utc).year + 1)
+    return transitions
+
+
+def tzif_data(name):
+    '''The TZif file of a zone or link; raises ``ValueError`` for unknown names and paths outside the tzdata.'''
+    path = None if name.startswith('/') or '..' in name.split('/') else tzdata_file(name)
+    if path is None:
+        raise ValueError(f'unknown time zone {name!r}')
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TransitionStore:
+    '''Transition tables of the zones in use, shared between links and bounded in memory.
+
+    A zone is read on first use (from the compiled artifact when there is one, else its TZif file)
+    with its footer rule expanded only to the next year; later years are added as conversions reach
+    them. Links share their target's table. Past ``max_bytes``, whether after a load or after a table
+    grew, the least recently used tables are dropped and read again when needed; the one in use is kept.
+    '''
+
+    def __init__(self, max_bytes: int = 16 << 20):
+        self.max_bytes = max_bytes
+        self._tables   = OrderedDict()
+        self._keys     = {}
+        self._lock     = threading.Lock()
+
+    def __len__(self):
+        return len(self._tables)
+
+    @property
+    def nbytes(self):
+        return sum(table.nbytes for table in list(self._tables.values()))
+
+    def get(self, name):
+        key = self._keys.get(name)
+        with self._lock:
+            if key in self._tables:
+                self._tables.move_to_end(key)
+                return self._tables[key]
+        key, table = self._load(name)
+        with self._lock:
+            # links and zones with identical data resolve to one key, the first table loaded wins
+            if key not in self._tables:
+                self._tables[key] = table
+                # a table that grows may take the store past max_bytes
+                table.on_grow     = partial(self._grown, key)
+            table = self._tables[key]
+            self._tables.move_to_end(key)
+            self._keys[name] = key
+            self._evict()
+        return table
+
+    def _load(self, name):
+        loaded = artifact()
+        if loaded is not None:
+            arrays = loaded.zone_arrays(name)
+            if arrays is not None:
+                canonical = loaded.header['aliases'].get(name, name)
+                footer    = loaded.zone_footer(canonical)
+                until     = loaded.header['until_year'] + 1 if footer else None
+                return canonical, ZoneTransitions(canonical, *arrays, footer, until)
+        data = tzif_data(name)
+        return hashlib.blake2b(data, digest_size=16).digest(), read_tzif(name, data, None)
+
+    def _grown(self, key, table):
+        with self._lock:
+            if self._tables.get(key) is table:
+                self._tables.move_to_end(key)
+                self._evict()
+
+    def _evict(self):
+        total = self.nbytes
+        while total > self.max_bytes and len(self._tables) > 1:
+            key, table = self._tables.popitem(last=False)
+            total     -= table.nbytes
+            table.on_grow = None
+            for name in [name for name, target in self._keys.items() if target == key]:
+                del self._keys[name]
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self._keys.clear()
+
+
+@lru_cache(maxsize=None)
+def transition_store():
+    return TransitionStore()
+
+
+def load_transitions(name, until_year=None):
+    '''The shared transition table of a zone or link, expanded at least to the end of ``until_year``.'''
+    transitions = transition_store().get(name)
+    if until_year is not None:
+        transitions.extend(until_year)
+    return transitions
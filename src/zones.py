@@ -0,0 +1,172 @@
+import os
+from array import array
+from collections import defaultdict, namedtuple
+from datetime import datetime, timezone
+from functools import lru_cache
+from sys import intern
+from zoneinfo import TZPATH, ZoneInfo
+
+from .artifact import artifact
+from .table import GENERIC_TIME_TABLE, COUNTRY_TIME_TABLE
+
+
+Zone = namedtuple('Zone', 'name countries comment kind backzone std dst abbr')
+
+# ISO country codes that are also US state postal codes (and 'LA' for Los Angeles), with the zones of
+# that reading: 'GA' is Gabon or Georgia, 'NC' New Caledonia or North Carolina
+US_ABBREVIATIONS = {
+    'AL': ('America/Chicago',), 'AR': ('America/Chicago',), 'CA': ('America/Los_Angeles',),
+    'CO': ('America/Denver',), 'DE': ('America/New_York',), 'GA': ('America/New_York',),
+    'ID': ('America/Boise',), 'IL': ('America/Chicago',), 'IN': ('America/Indiana/Indianapolis',),
+    'KY': ('America/New_York',), 'LA': ('America/Chicago', 'America/Los_Angeles'), 'MA': ('America/New_York',),
+    'MD': ('America/New_York',), 'ME': ('America/New_York',), 'MN': ('America/Chicago',),
+    'MO': ('America/Chicago',), 'MS': ('America/Chicago',), 'NC': ('America/New_York',),
+    'NE': ('America/Chicago',), 'PA': ('America/New_York',), 'SC': ('America/New_York',),
+    'SD': ('America/Chicago',), 'TN': ('America/Chicago',), 'VA': ('America/New_York',),
+}
+
+
+def parse_offset(text):
+    # the table writes negative offsets with the unicode minus sign
+    sign = -1 if text[0] in '-−' else 1
+    hours, minutes = text[1:].split(':')
+    return sign * (int(hours) * 60 + int(minutes))
+
+
+def format_offset(minutes):
+    sign = '-' if minutes < 0 else '+'
+    hours, minutes = divmod(abs(minutes), 60)
+    return f'{sign}{hours:02d}:{minutes:02d}'
+
+
+class ZoneIndex:
+    '''Column-oriented view of the zone tables.
+
+    Every table line is one row; rows listing several countries (``AE, OM, RE, SC, TF``)
+    get one entry per country. Row columns are indexed by row id, entry columns by entry id,
+    and ``row_start`` maps a row to its slice of entries.
+    '''
+
+    def __init__(self, *tables):
+        self.lines     = []           # original table line
+        self.keys      = []           # lower-cased line, used for fuzzy scoring
+        self.name      = []           # TZ identifier
+        self.comment   = []
+        self.kind      = []           # 'Canonical' or 'Link'
+        self.backzone  = array('b')   # 1 for Link† rows (link only outside backzone)
+        self.std       = array('h')   # STD offset in minutes
+        self.dst       = array('h')   # DST offset in minutes
+        self.abbr      = []           # STD abbreviation
+        self.row_start = array('H', [0])
+        self.country   = []           # ISO 3166 code per entry ('' for generic zones)
+        self.row       = array('H')   # row id per entry
+
+        for table in tables:
+            for line in table.split('\n'):
+                if line.strip():
+                    self._add(line)
+
+        self.by_name = {name: row for row, name in enumerate(self.name)}
+
+    def _add(self, line):
+        codes, name, comment, kind, std, dst, abbr = line.split('\t')
+        row = len(self.name)
+        self.lines.append(line)
+        self.keys.append(line.lower())
+        self.name.append(intern(name))
+        self.comment.append(intern(comment))
+        self.kind.append(intern(kind.rstrip('†')))
+        self.backzone.append(kind.endswith('†'))
+        self.std.append(parse_offset(std))
+        self.dst.append(parse_offset(dst))
+        self.abbr.append(intern(abbr))
+        for code in codes.split(','):
+            self.country.append(intern(code.strip()))
+            self.row.append(row)
+        self.row_start.append(len(self.country))
+
+    def __len__(self):
+        return len(self.name)
+
+    def countries(self, row):
+        return tuple(self.country[self.row_start[row]:self.row_start[row + 1]])
+
+    def zone(self, row):
+        return Zone(self.name[row], self.countries(row), self.comment[row], self.kind[row],
+                    bool(self.backzone[row]), self.std[row], self.dst[row], self.abbr[row])
+
+    def lookup(self, name):
+        row = self.by_name.get(name)
+        return None if row is None else self.zone(row)
+
+
+@lru_cache(maxsize=None)
+def zone_index():
+    # rows compiled from the system tzdata by ``python -m src.build``, else the embedded tables
+    loaded = artifact()
+    if loaded is not None:
+        return ZoneIndex('\n'.join(loaded.rows))
+    return ZoneIndex(GENERIC_TIME_TABLE, COUNTRY_TIME_TABLE)
+
+
+def tzdata_file(name):
+    for path in TZPATH:
+        path = os.path.join(path, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def read_country_names(path):
+    # 'Britain (UK)' is reachable as 'britain', 'uk' and 'britain (uk)', 'Korea (South)' also as 'south korea'
+    names = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or '\t' not in line:
+                continue
+            code, name = line.rstrip('\n').split('\t')[:2]
+            names[name.lower()] = code
+            if '(' in name:
+                base, extra = name.rstrip(')').split(' (', 1)
+                names.setdefault(base.lower(), code)
+                names.setdefault(extra.lower() if extra.isupper() else f'{extra} {base}'.lower(), code)
+    return names
+
+
+@lru_cache(maxsize=None)
+def country_names():
+    loaded = artifact()
+    if loaded is not None:
+        return loaded.header['country_names']
+    path  = tzdata_file('iso3166.tab')
+    return {} if path is None else read_country_names(path)
+
+
+@lru_cache(maxsize=None)
+def abbreviations():
+    # abbreviation -> {offset in minutes: [rows]}; the table only lists STD names, so the
+    # DST names (CEST, PDT, BST, ...) are read from the system tzdata for zones observing DST
+    index = zone_index()
+    abbrs = defaultdict(lambda: defaultdict(list))
+    year  = datetime.now(timezone.utc).year
+    for row in range(len(index)):
+        if index.abbr[row].isalpha():
+            abbrs[index.abbr[row]][index.std[row]].append(row)
+        if index.std[row] == index.dst[row]:
+            continue
+        zone = ZoneInfo(index.name[row])
+        for month in (1, 7):
+            local = datetime(year, month, 15, 12, tzinfo=zone)
+            name  = local.tzname()
+            if name.isalpha() and local.dst() and local.utcoffset().total_seconds() // 60 == index.dst[row]:
+                abbrs[name][index.dst[row]].append(row)
+    return {abbr: dict(offsets) for abbr, offsets in abbrs.items()}
+
+
+def dominant_offsets(offsets, ratio: int = 5):
+    # 'PST' is Pacific time in nine zones and Philippine time in one: a reading used by ``ratio`` times
+    # more zones than any other wins, closer calls ('CST', 'IST') stay ambiguous
+    counts = sorted(((len(rows), offset) for offset, rows in offsets.items()), reverse=True)
+    if len(counts) > 1 and counts[0][0] >= ratio * counts[1][0]:
+        return [counts[0][1]]
+    return list(offsets)
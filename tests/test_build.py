@@ -0,0 +1,46 @@
+import pytest
+
+from src.artifact import _PREFIX, ARTIFACT_ENV, FORMAT, MAGIC, Artifact, artifact
+from src.build import build, tzdata_directory
+
+
+pytestmark = pytest.mark.skipif(tzdata_directory() is None, reason='no tzdata.zi on TZPATH')
+
+
+@pytest.fixture(scope='module')
+def path(tmp_path_factory):
+    return build(output=str(tmp_path_factory.mktemp('artifact') / 'zones.tzix'), until_year=2040)
+
+
+@pytest.fixture(scope='module')
+def rows(path):
+    return [row.split('\t') for row in Artifact(path).rows]
+
+
+def test_links_outside_the_tab_files_have_no_countries(rows):
+    codes = {row[1]: row[0] for row in rows}
+    assert codes['Atlantic/Jan_Mayen'] == ''
+    assert codes['Europe/Berlin'].startswith('DE')
+
+
+def test_canonical_zones_lead_their_country(rows):
+    germany = [row[1] for row in rows if row[0].split(', ')[0] == 'DE']
+    assert germany[0] == 'Europe/Berlin'
+    assert germany.index('Europe/Berlin') < germany.index('Europe/Busingen')
+
+
+def test_artifacts_of_another_format_are_ignored(path, tmp_path, monkeypatch):
+    data = bytearray(open(path, 'rb').read())
+    _, _, size = _PREFIX.unpack_from(data)
+    _PREFIX.pack_into(data, 0, MAGIC, FORMAT - 1, size)
+    stale = tmp_path / 'stale.tzix'
+    stale.write_bytes(data)
+    with pytest.raises(ValueError, match='format'):
+        Artifact(str(stale))
+    monkeypatch.setenv(ARTIFACT_ENV, str(stale))
+    artifact.cache_clear()
+    try:
+        with pytest.warns(UserWarning, match='ignoring zone artifact'):
+            assert artifact() is None
+    finally:
+        artifact.cache_clear()
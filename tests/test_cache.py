@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from src.cache import ResponseCache, SQLiteCache, next_transition
+from src.parser import parse_query
+
+
+def clock_at(*args):
+    now = [datetime(*args, tzinfo=timezone.utc).timestamp()]
+    return now, lambda: now[0]
+
+
+def test_equivalent_requests_share_a_key():
+    cache = ResponseCache(clock=clock_at(2026, 7, 1, 12)[1])
+    keys  = {cache.key(parse_query(text)) for text in
+             ('2PM CEST in Taiwan', '14:00 CEST to taiwan time?', 'What is 2 pm CEST in Taiwan')}
+    assert len(keys) == 1
+    assert cache.key(parse_query('3PM CEST in Taiwan')) not in keys
+
+
+def test_requests_without_a_date_are_keyed_on_the_day():
+    now, clock = clock_at(2026, 7, 1, 23, 59)
+    cache = ResponseCache(clock=clock)
+    key   = cache.key(parse_query('2PM CEST in Taiwan'))
+    now[0] += 120
+    assert cache.key(parse_query('2PM CEST in Taiwan')) != key
+    dated = cache.key(parse_query('2PM CEST in Taiwan on 2026-07-01'))
+    now[0] += 86400
+    assert cache.key(parse_query('14:00 CEST to taiwan time on 2026-07-01')) == dated
+
+
+def test_now_questions_share_a_bucket():
+    now, clock = clock_at(2026, 7, 1, 12, 0, 5)
+    cache = ResponseCache(now_bucket=60, clock=clock)
+    key   = cache.key(parse_query('What time is it in Tokyo now?'))
+    now[0] += 30
+    assert cache.key(parse_query('What time is it in Tokyo now?')) == key
+    now[0] += 30
+    assert cache.key(parse_query('What time is it in Tokyo now?')) != key
+
+
+def test_entries_expire_after_the_ttl():
+    now, clock = clock_at(2026, 7, 1, 12)
+    cache = ResponseCache(ttl=60, clock=clock)
+    cache.put('key', 'answer', 'llm')
+    now[0] += 59
+    assert cache.get('key').value == 'answer'
+    now[0] += 1
+    assert cache.get('key') is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_entries_expire_at_the_next_transition():
+    now, clock = clock_at(2026, 10, 24, 12)
+    cache = ResponseCache(ttl=7 * 86400, clock=clock)
+    cache.put('key', 'answer', 'llm', [ZoneInfo('Europe/Berlin'), ZoneInfo('Asia/Tokyo')])
+    change = datetime(2026, 10, 25, 1, tzinfo=timezone.utc).timestamp()
+    assert next_transition(ZoneInfo('Europe/Berlin'), now[0], now[0] + 7 * 86400) == change
+    now[0] = change - 1
+    assert cache.get('key') is not None
+    now[0] = change
+    assert cache.get('key') is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(maxsize=2, clock=clock_at(2026, 7, 1)[1])
+    cache.put('a', 1, 'llm')
+    cache.put('b', 2, 'llm')
+    cache.get('a')
+    cache.put('c', 3, 'llm')
+    assert cache.get('b') is None and cache.get('a').value == 1 and len(cache) == 2
+
+
+def test_durations_are_part_of_the_key():
+    cache = ResponseCache(clock=clock_at(2026, 7, 1, 12)[1])
+    three = cache.key(parse_query('What time will it be in Tokyo in 3 hours?'))
+    five  = cache.key(parse_query('What time will it be in Tokyo in 5 hours?'))
+    assert three != five
+    cache.put(three, 'three hours', 'llm')
+    assert cache.get(five) is None
+
+
+def test_sqlite_entries_outlive_the_instance(tmp_path):
+    clock = clock_at(2026, 7, 1, 12)[1]
+    SQLiteCache(str(tmp_path / 'cache.db'), settings='model', clock=clock).put('key', 'answer', 'llm')
+    assert SQLiteCache(str(tmp_path / 'cache.db'), settings='model', clock=clock).get('key').value == 'answer'
+    assert SQLiteCache(str(tmp_path / 'cache.db'), settings='other', clock=clock).get('key') is None
+
+
+def test_sqlite_entries_expire_after_the_ttl(tmp_path):
+    now, clock = clock_at(2026, 7, 1, 12)
+    cache = SQLiteCache(str(tmp_path / 'cache.db'), ttl=60, clock=clock)
+    cache.put('key', 'answer', 'llm')
+    now[0] += 59
+    assert cache.get('key').value == 'answer'
+    now[0] += 1
+    assert cache.get('key') is None and len(cache) == 0
+
+
+def test_sqlite_cache_is_pruned_to_maxsize(tmp_path):
+    now, clock = clock_at(2026, 7, 1, 12)
+    cache = SQLiteCache(str(tmp_path / 'cache.db'), maxsize=4, clock=clock, prune_every=3)
+    for i in range(6):
+        now[0] += 1
+        cache.put(f'key{i}', i, 'llm')
+    # pruned on the third and sixth insert, the least recently used first
+    assert len(cache) == 4
+    assert cache.get('key1') is None and cache.get('key2').value == '2'
+    now[0] += 1
+    cache.put('key6', 6, 'llm')
+    assert len(cache) == 5
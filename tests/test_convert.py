@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, available_timezones
+
+import numpy as np
+import pytest
+
+from src.convert import convert_many, zone_transitions
+
+
+ZONES   = sorted(name for name in available_timezones() if not name.startswith(('posix/', 'right/')))
+# 1850 to 2200: the explicit transitions and well into the years the footer rules are expanded for
+FIRST   = int(datetime(1850, 1, 1, tzinfo=timezone.utc).timestamp())
+LAST    = int(datetime(2200, 1, 1, tzinfo=timezone.utc).timestamp())
+SAMPLES = 200
+EPOCH   = datetime(1970, 1, 1)
+
+
+def edges(name):
+    # every transition instant and the seconds around it, as UTC and as the wall-clock times on either side
+    transitions = zone_transitions(name)
+    transitions.extend(2199)
+    instants = transitions.instants[1:]
+    keep     = (instants > FIRST) & (instants < LAST)
+    before   = transitions.offsets[:-1][keep]
+    after    = transitions.offsets[1:][keep]
+    instants = instants[keep]
+    utc      = (instants[:, None] + np.array([-1, 0, 1])).ravel()
+    local    = np.concatenate([(instants + offsets)[:, None] + np.array([-1, 0, 1]) for offsets in (before, after)]).ravel()
+    return utc, local
+
+
+def sample(name):
+    rng = np.random.default_rng(sum(map(ord, name)))
+    return rng.integers(FIRST, LAST, SAMPLES)
+
+
+def as_datetime64(seconds):
+    return np.asarray(seconds, np.int64).astype('datetime64[s]')
+
+
+def wall(second, zone):
+    # zoneinfo's wall-clock seconds for a UTC instant
+    moment = datetime.fromtimestamp(second, timezone.utc).astimezone(zone)
+    return second + int(moment.utcoffset().total_seconds())
+
+
+def utc(local, zone):
+    # zoneinfo with fold=0: ambiguous times take the earlier instant, times in a gap move forward
+    return int((EPOCH + timedelta(seconds=local)).replace(tzinfo=zone).timestamp())
+
+
+@pytest.mark.parametrize('name', ZONES)
+def test_convert_many_matches_zoneinfo(name):
+    zone       = ZoneInfo(name)
+    instants, local = edges(name)
+    instants = np.concatenate((instants, sample(name)))
+    local    = np.concatenate((local, sample(name)))
+    np.testing.assert_array_equal(convert_many(as_datetime64(instants), 'UTC', name),
+                                  as_datetime64([wall(int(second), zone) for second in instants]))
+    np.testing.assert_array_equal(convert_many(as_datetime64(local), name, 'UTC'),
+                                  as_datetime64([utc(int(second), zone) for second in local]))
+
+
+def test_convert_many_between_zone_arrays():
+    rng      = np.random.default_rng(0)
+    names    = np.array(ZONES)
+    sources  = names[rng.integers(0, len(names), 2000)]
+    targets  = names[rng.integers(0, len(names), 2000)]
+    local    = rng.integers(FIRST, LAST, 2000)
+    expected = [wall(utc(int(second), ZoneInfo(source)), ZoneInfo(target))
+                  for second, source, target in zip(local, sources, targets)]
+    np.testing.assert_array_equal(convert_many(as_datetime64(local), sources, targets), as_datetime64(expected))
+
+
+def test_nat_stays_nat():
+    converted = convert_many(np.array(['2026-07-01T12:00', 'NaT'], 'datetime64[s]'), 'Europe/Berlin', 'Asia/Tokyo')
+    assert str(converted[0]) == '2026-07-01T19:00:00' and np.isnat(converted[1])
@@ -0,0 +1,111 @@
+from src.core import TimezoneCore
+from src.prompt import ROW_HEADER, PromptBuilder, estimate_tokens, render_row
+from src.search import trigram_index
+from src.zones import zone_index
+from src.result import ResultError, TimeResult
+
+import pytest
+
+
+def pipeline(reply, **options):
+    core    = TimezoneCore(server='', **options)
+    core.fn = lambda data, *args, **kwargs: reply(data) if callable(reply) else reply
+    return core
+
+
+def test_hybrid_flags_a_reply_outside_the_schema():
+    answer = pipeline('It is 5:00 UTC.', hybrid=True).forward('convert 10:30 IST to UTC')
+    assert answer.path == 'llm'
+    assert str(answer) == 'It is 5:00 UTC. Not verified: reply is not in the result schema.'
+
+
+def test_structured_hybrid_keeps_the_unreadable_reply():
+    result = pipeline('It is 5:00 UTC.', structured=True, hybrid=True).forward('convert 10:30 IST to UTC')
+    assert isinstance(result, TimeResult)
+    assert result.verified is False and result.target is None
+    assert result.reply == 'It is 5:00 UTC.'
+    assert result.issues == ['reply is not in the result schema']
+
+
+def test_structured_raises_for_a_reply_outside_the_schema():
+    with pytest.raises(ResultError):
+        pipeline('It is 5:00 UTC.', structured=True).forward('convert 10:30 IST to UTC')
+
+
+def test_batch_returns_failures_in_place():
+    def reply(data):
+        if 'CST' in str(data):
+            raise RuntimeError('model unavailable')
+        return 'It is 5:00 UTC.'
+
+    answers = pipeline(reply).forward_many(['convert 10:30 IST to UTC', 'convert 10:30 CST to UTC',
+                                            'What is 2pm CEST in Tokyo?'])
+    assert str(answers[0]) == 'It is 5:00 UTC.'
+    assert isinstance(answers[1], RuntimeError)
+    assert answers[2].path == 'local'
+
+
+def test_stats_count_cache_hits():
+    from src.cache import ResponseCache
+    from src.stats import PipelineStats
+
+    cache, stats, seen = ResponseCache(), PipelineStats(), []
+    stats.add_hook(lambda stage, seconds, info: stage == 'cache' and seen.append(info['hit']))
+    core = pipeline('It is 5:00 UTC.', cache=cache, stats=stats)
+    for _ in range(3):
+        core.forward('convert 10:30 IST to UTC')
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+    snapshot = stats.snapshot()
+    assert (snapshot['cache_hits'], snapshot['cache_misses']) == (2, 1)
+    assert seen == [False, True, True]
+
+
+def test_batch_keeps_durations_apart():
+    answers = pipeline(lambda data: 'in 3 hours' if '3 hours' in str(data) else 'in 5 hours').forward_many(
+        ['What time will it be in Tokyo in 3 hours?', 'What time will it be in Tokyo in 5 hours?'])
+    assert [str(answer) for answer in answers] == ['in 3 hours', 'in 5 hours']
+
+
+def test_batch_keeps_planning_failures_in_place(monkeypatch):
+    core = pipeline('It is 5:00 UTC.')
+    plan = core.plan
+
+    def failing(request, k=10):
+        if 'IST' in str(request):
+            raise ValueError('cannot plan')
+        return plan(request, k)
+
+    monkeypatch.setattr(core, 'plan', failing)
+    answers = core.forward_many(['which zones use IST at 2026-07-01 09:00?', 'now in Tokyo'])
+    assert isinstance(answers[0], ValueError)
+    assert answers[1].path == 'local'
+
+
+def test_find_substring_keeps_the_case_of_identifiers():
+    lines = TimezoneCore(server='').find_substring('Tokyo', k=3)
+    assert any('\tAsia/Tokyo\t' in line for line in lines)
+
+
+def test_trigram_index_finds_misspelled_zones():
+    index = zone_index()
+    assert index.name[trigram_index().search('Kolkatta', 3)[0][0]] == 'Asia/Kolkata'
+    # the words of a whole request do not drown the place
+    assert index.name[trigram_index().search('What time is it in Kolkatta?', 3)[0][0]] == 'Asia/Kolkata'
+
+
+def test_prompt_holds_the_rows_within_the_token_budget():
+    index   = zone_index()
+    rows    = [index.by_name[name] for name in ('Asia/Tokyo', 'Europe/Berlin', 'America/New_York')]
+    builder = PromptBuilder(token_budget=estimate_tokens(render_row(rows[0])) + estimate_tokens(render_row(rows[1])) + 2)
+    prompt  = builder.build('noon in Tokyo to Berlin', rows + rows[:1])
+    assert prompt.splitlines()[1:3] == [render_row(rows[0]), render_row(rows[1])]
+    assert 'America/New_York' not in prompt and ROW_HEADER not in prompt
+    assert ROW_HEADER in builder.static() and builder.static() is builder.static()
+
+
+def test_local_extraction_retrieves_each_place_in_one_model_call():
+    prompts = []
+    core    = pipeline(lambda data: prompts.append(data) or 'ok', local=False, extraction='local')
+    assert core.forward('What is 2pm in Bangalore in Silicon Valley time?').value == 'ok'
+    assert len(prompts) == 1
+    assert [line.split(' | ')[0] for line in prompts[0].splitlines()[1:3]] == ['Asia/Kolkata', 'America/Los_Angeles']
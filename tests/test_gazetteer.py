@@ -0,0 +1,30 @@
+import pytest
+
+from src.core import TimezoneCore
+from src.gazetteer import place_index, places
+from src.zones import zone_index
+
+
+@pytest.mark.parametrize('place, zone', [
+    ('bangalore', 'Asia/Kolkata'),
+    ('silicon valley', 'America/Los_Angeles'),
+    ('bavaria', 'Europe/Berlin'),
+])
+def test_gazetteer_places(place, zone):
+    assert [zone_index().name[row] for row in places()[0][place]] == [zone]
+
+
+def test_misspelled_place_is_found():
+    name, rows, score = place_index().search('Bangalor', k=1)[0]
+    assert name == 'bangalore' and zone_index().name[rows[0]] == 'Asia/Kolkata'
+    assert score >= 0.5
+
+
+def test_country_resolves_to_the_zone_listing_it_first():
+    rows = TimezoneCore().retrieve('Germany')
+    assert zone_index().name[rows[0][0]] == 'Europe/Berlin'
+
+
+def test_gazetteer_rows_come_before_trigram_matches():
+    rows = TimezoneCore().retrieve('Silicon Valey')
+    assert zone_index().name[rows[0][0]] == 'America/Los_Angeles'
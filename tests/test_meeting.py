@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from src.meeting import common_hours, find_slots
+
+
+def utc(text):
+    return np.datetime64(text, 'm')
+
+
+def test_common_hours_follow_a_dst_change_within_the_week():
+    # New York moves to EDT on Sunday 2026-03-08, Berlin only on 2026-03-29
+    hours = common_hours(['Europe/Berlin', 'America/New_York'], '2026-03-06', '2026-03-10')
+    assert hours == [(utc('2026-03-06T14:00'), utc('2026-03-06T16:00')),
+                     (utc('2026-03-09T13:00'), utc('2026-03-09T16:00')),
+                     (utc('2026-03-10T13:00'), utc('2026-03-10T16:00'))]
+
+
+def test_slots_without_common_hours():
+    participants = ['Asia/Tokyo', 'America/New_York']
+    assert common_hours(participants, '2026-07-06', '2026-07-10') == []
+    assert find_slots(participants, '2026-07-06', '2026-07-10', min_attendees=2) == []
+    slot = find_slots(participants, '2026-07-06', '2026-07-10', top=1)[0]
+    assert slot.attendees == 1 and len(slot.missing) == 1
+
+
+def test_short_meetings_take_one_slot():
+    slot = find_slots(['Europe/Berlin'], '2026-07-06', '2026-07-06', duration=15, top=1)[0]
+    assert (slot.start, slot.end) == (utc('2026-07-06T07:00'), utc('2026-07-06T07:15'))
+
+
+@pytest.mark.parametrize('duration', [0, -30])
+def test_duration_must_be_positive(duration):
+    with pytest.raises(ValueError, match='duration'):
+        find_slots(['Europe/Berlin'], '2026-07-06', '2026-07-10', duration=duration)
@@ -0,0 +1,21 @@
+import numpy as np
+
+from src.convert import convert_many
+from src.core import TimezoneCore
+from src.parallel import ShardedPool
+
+
+def test_convert_many_accepts_object_zone_arrays():
+    timestamps = np.array(['2026-03-29T01:30', '2026-10-25T02:30', '2026-07-01T12:00'] * 4, 'datetime64[s]')
+    zones      = np.array(['Europe/Berlin', 'America/New_York', 'Asia/Kolkata'] * 4, dtype=object)
+    with ShardedPool(workers=2) as pool:
+        converted = pool.convert_many(timestamps, zones, 'UTC', chunk_size=5)
+    np.testing.assert_array_equal(converted, convert_many(timestamps, zones, 'UTC'))
+
+
+def test_forward_keeps_the_input_order():
+    requests = [f'What is {hour}:00 UTC in Tokyo on 2026-07-01?' for hour in range(10, 20)]
+    with ShardedPool(workers=2, chunk_size=3) as pool:
+        answers = pool.forward_many(requests)
+    core = TimezoneCore(server='')
+    assert [str(answer) for answer in answers] == [str(core.forward(request)) for request in requests]
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.parser import parse_query, resolve
+
+
+NOW = datetime(2026, 7, 1, 12, tzinfo=timezone.utc)
+
+
+def zone_names(mention):
+    return [getattr(zone, 'key', None) or zone.tzname(None) for zone in mention.zones]
+
+
+@pytest.mark.parametrize('text', [
+    'noon in LA in Tokyo',
+    'now in LA',
+    '9am in NC to London',
+    '3pm in MA to Tokyo',
+    '10am GA time in Paris',
+])
+def test_country_codes_shared_with_us_states_are_ambiguous(text):
+    query = parse_query(text)
+    assert not query.confident
+    assert query.settle(NOW) is None
+
+
+def test_us_state_reading_is_offered():
+    query = parse_query('9am in NC to London')
+    assert zone_names(query.source) == ['Pacific/Noumea', 'America/New_York']
+
+
+def test_other_country_codes_stay_confident():
+    query = parse_query('3pm in JP to London')
+    assert query.confident
+    assert str(query.convert(NOW)).startswith('3:00 PM JST')
+
+
+@pytest.mark.parametrize('text, source, target', [
+    ('What time in Tokyo is 2PM CEST?', 'CEST', 'Asia/Tokyo'),
+    ('2PM CEST in Tokyo', 'CEST', 'Asia/Tokyo'),
+    ('London 14:00 to Tokyo', 'Europe/London', 'Asia/Tokyo'),
+    ('What is 14:00 in London in Tokyo?', 'Europe/London', 'Asia/Tokyo'),
+    ('Convert to Tokyo from London 14:00', 'Europe/London', 'Asia/Tokyo'),
+])
+def test_source_is_the_zone_next_to_the_time(text, source, target):
+    query = parse_query(text)
+    assert query.confident
+    assert zone_names(query.source) == [source]
+    assert zone_names(query.target) == [target]
+
+
+def test_mention_before_the_time_is_not_the_source():
+    conversion = parse_query('What time in Tokyo is 2PM CEST?').convert(NOW)
+    assert conversion.source.strftime('%H:%M %Z') == '14:00 CEST'
+    assert conversion.target.strftime('%H:%M %Z') == '21:00 JST'
+
+
+@pytest.mark.parametrize('text, offset', [('2pm CET in India', '+01:00'), ('2pm EET in India', '+02:00'),
+                                          ('2pm WET in India', '+00:00'), ('2pm CEST in India', '+02:00')])
+def test_legacy_zone_names_read_as_abbreviations_in_summer(text, offset):
+    conversion = parse_query(text).convert(NOW)
+    assert conversion.source.isoformat().endswith(offset)
+    assert conversion.source.strftime('%H:%M') == '14:00'
+
+
+def test_dominant_reading_of_an_abbreviation_wins():
+    # PST is Pacific time in nine zones and Philippine time in one
+    assert [zone.utcoffset(None).total_seconds() / 3600 for zone in resolve('PST')] == [-8]
+    assert parse_query('2pm PST in Tokyo').confident
+
+
+def test_close_readings_stay_ambiguous():
+    assert {zone.utcoffset(None).total_seconds() / 3600 for zone in resolve('CST')} == {-6, 8, -5}
+    assert {zone.utcoffset(None).total_seconds() / 3600 for zone in resolve('IST')} == {5.5, 2, 1}
+    assert not parse_query('2pm IST in Tokyo').confident
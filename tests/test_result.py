@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.parser import parse_query
+from src.result import ResultError, TimeResult, parse_reply, schema_errors
+
+
+NOW = datetime(2026, 7, 1, 12, tzinfo=timezone.utc)
+
+
+def result(text):
+    return TimeResult.from_conversion(parse_query(text).convert(NOW))
+
+
+def test_dst_flag_of_abbreviations():
+    assert result('2PM CEST in Tokyo').source_dst is True
+    assert result('2PM PST in Tokyo').source_dst is False
+    assert result('2PM UTC+05:30 in Tokyo').source_dst is None
+
+
+def test_reply_following_the_schema():
+    reply = parse_reply('{"source": "2026-07-01T14:00", "source_zone": "Europe/Berlin", '
+                        '"target": "2026-07-01T21:00", "target_zone": "Asia/Tokyo"}')
+    assert (reply.source_offset, reply.source_dst, reply.target_offset) == (120, True, 540)
+
+
+@pytest.mark.parametrize('values, error', [
+    ({'target': '2026-07-01T21:00', 'target_zone': 'Asia/Tokyo'}, "'source' is missing"),
+    ({'source': None, 'source_zone': None, 'target': '2026-07-01T21:00', 'target_zone': 'Asia/Tokyo', 'note': ''},
+     "'note' is not in the schema"),
+    ({'source': 14, 'source_zone': None, 'target': '2026-07-01T21:00', 'target_zone': 'Asia/Tokyo'},
+     "'source' is not string or null"),
+])
+def test_replies_breaking_the_schema(values, error):
+    assert error in schema_errors(values)
+    with pytest.raises(ResultError):
+        parse_reply(str(values).replace("'", '"').replace('None', 'null'))
@@ -0,0 +1,31 @@
+import pytest
+
+from src.reverse import answer
+
+
+def test_offset_on_a_date():
+    assert answer('which zones are at UTC+05:30 on 2026-01-01?') == \
+        'Time zones at UTC+05:30 on 2026-01-01 12:00 UTC: Asia/Kolkata, Asia/Colombo.'
+
+
+def test_abbreviation_on_a_date_and_time():
+    reply = answer('which zones use IST on 2026-07-01 9:00?')
+    assert reply.startswith('Time zones at IST on 2026-07-01 09:00 UTC:')
+    assert 'Asia/Kolkata' in reply and 'Europe/Dublin' in reply
+
+
+def test_country():
+    reply = answer('Which time zones are in AU?')
+    assert reply.startswith('Time zones in AU:')
+    assert 'Australia/Sydney' in reply and 'Australia/Perth' in reply
+
+
+@pytest.mark.parametrize('text', [
+    # a US state code, an unknown word and an impossible date are left to the parser
+    'which zones are in CA?',
+    'Which zones are in FOO?',
+    'which zones use IST on 2026-02-30?',
+    'what time is it in Tokyo?',
+])
+def test_falls_back(text):
+    assert answer(text) is None
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from src.schedule import Schedule, ScheduleError, expand, expand_many
+
+
+DAILY = Schedule('Europe/Berlin', '02:30')
+
+
+def utc(*args):
+    return np.datetime64(datetime(*args), 's')
+
+
+@pytest.mark.parametrize('gap, expected', [
+    ('forward', [utc(2026, 3, 28, 1, 30), utc(2026, 3, 29, 1, 30), utc(2026, 3, 30, 0, 30)]),
+    ('backward', [utc(2026, 3, 28, 1, 30), utc(2026, 3, 29, 0, 30), utc(2026, 3, 30, 0, 30)]),
+    ('skip', [utc(2026, 3, 28, 1, 30), utc(2026, 3, 30, 0, 30)]),
+])
+def test_gap_policies(gap, expected):
+    assert expand(DAILY, '2026-03-28', '2026-03-30', gap=gap).tolist() == [value.item() for value in expected]
+
+
+@pytest.mark.parametrize('fold, expected', [
+    ('earlier', [utc(2026, 10, 24, 0, 30), utc(2026, 10, 25, 0, 30), utc(2026, 10, 26, 1, 30)]),
+    ('later', [utc(2026, 10, 24, 0, 30), utc(2026, 10, 25, 1, 30), utc(2026, 10, 26, 1, 30)]),
+    ('skip', [utc(2026, 10, 24, 0, 30), utc(2026, 10, 26, 1, 30)]),
+])
+def test_fold_policies(fold, expected):
+    assert expand(DAILY, '2026-10-24', '2026-10-26', fold=fold).tolist() == [value.item() for value in expected]
+
+
+def test_raise_policies():
+    with pytest.raises(ScheduleError, match='nonexistent'):
+        expand(DAILY, '2026-03-28', '2026-03-30', gap='raise')
+    with pytest.raises(ScheduleError, match='ambiguous'):
+        expand(DAILY, '2026-10-24', '2026-10-26', fold='raise')
+    # days without a gap or fold do not raise
+    assert len(expand(DAILY, '2026-07-01', '2026-07-31', gap='raise', fold='raise')) == 31
+
+
+@pytest.mark.parametrize('zone', ['Europe/Berlin', 'America/New_York', 'Australia/Lord_Howe', 'America/Santiago',
+                                  'Asia/Kolkata', 'Africa/Casablanca'])
+def test_defaults_match_zoneinfo(zone):
+    # forward and earlier are what zoneinfo does with fold=0
+    schedule = Schedule(zone, ['00:30', '01:30', '02:00', '02:30', '03:00', '12:00'])
+    expanded = expand(schedule, '2024-01-01', '2026-12-31')
+    tz       = ZoneInfo(zone)
+    expected = [datetime.combine(day, datetime.strptime(time, '%H:%M').time(), tz).astimezone(timezone.utc).replace(tzinfo=None)
+                for day in (datetime(2024, 1, 1) + timedelta(days=n) for n in range(1096)) for time in schedule.times]
+    assert expanded.tolist() == expected
+
+
+def test_expand_many_matches_expand():
+    schedules = [DAILY, Schedule('America/New_York', ['09:00', '17:00'], weekdays=range(5)),
+                 Schedule('Europe/Berlin', '10:00', monthdays=[1, 15]), Schedule('Asia/Tokyo', '08:00')]
+    indptr, occurrences = expand_many(schedules, '2026-01-01', '2026-12-31', gap='skip')
+    for i, schedule in enumerate(schedules):
+        assert occurrences[indptr[i]:indptr[i + 1]].tolist() == expand(schedule, '2026-01-01', '2026-12-31', gap='skip').tolist()
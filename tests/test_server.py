@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+
+from src import client
+from src.core import REMOTE_OPTIONS, TimezoneCore
+from src.server import Server
+from src.stats import PipelineStats
+
+
+def test_requests_carry_the_pipeline_options(monkeypatch):
+    sent = {}
+
+    def ask(address, query, k=10, timeout=30.0, **options):
+        sent.update(options)
+        return 'answer', 'llm', False
+
+    monkeypatch.setattr(client, 'ask', ask)
+    TimezoneCore(server='/tmp/timezone.sock', local=False, token_budget=256, score_gap=None).forward('noon in Paris')
+    assert set(sent) == set(REMOTE_OPTIONS)
+    assert (sent['local'], sent['token_budget'], sent['score_gap']) == (False, 256, None)
+
+
+def test_own_cache_or_stats_answer_in_process(monkeypatch):
+    monkeypatch.setenv(client.SERVER_ENV, '/tmp/timezone.sock')
+    assert TimezoneCore().server == '/tmp/timezone.sock'
+    assert TimezoneCore(stats=PipelineStats()).server == ''
+
+
+def test_timeouts_are_not_answered_again(monkeypatch):
+    def ask(*args, **kwargs):
+        raise TimeoutError('timed out')
+
+    monkeypatch.setattr(client, 'ask', ask)
+    with pytest.raises(TimeoutError):
+        TimezoneCore(server='/tmp/timezone.sock').forward('What is 2pm CEST in Tokyo?')
+
+
+def test_server_picks_the_pipeline_of_the_options():
+    server = Server('/tmp/timezone-test.sock')
+    assert server.stats.snapshot()['paths'] == {}
+    defaults = {name: getattr(server.pipeline, name) for name in REMOTE_OPTIONS}
+    assert server.pipeline_for(**defaults) is server.pipeline
+    other = server.pipeline_for(**{**defaults, 'local': False})
+    assert other is not server.pipeline and other.local is False
+    assert server.pipeline_for(local=False) is other
+    response = asyncio.run(server.respond({'query': 'What is 2pm CEST in Tokyo?', **defaults}))
+    assert response['path'] == 'local'
+    assert server.stats.snapshot()['paths'] == {'local': 1}
+
+
+def test_stream_queries_are_refused_and_the_server_stays_up(tmp_path):
+    server = Server(str(tmp_path / 'timezone.sock'))
+
+    async def exchange():
+        listener = await asyncio.start_unix_server(server.handle, str(tmp_path / 'timezone.sock'))
+        async with listener:
+            reader, writer = await asyncio.open_unix_connection(str(tmp_path / 'timezone.sock'))
+            replies = []
+            for message in ({'query': '--stream -c a --from UTC --to UTC /etc/hostname -o /tmp/out.csv'},
+                            {'query': '--stream'}, {'command': 'ping'}):
+                writer.write(json.dumps(message).encode() + b'\n')
+                await writer.drain()
+                replies.append(json.loads(await reader.readline()))
+            writer.close()
+            return replies
+
+    refused, bare, ping = asyncio.run(exchange())
+    assert 'not accepted' in refused['error'] and 'not accepted' in bare['error']
+    assert ping == {'ok': True}
+    assert not (tmp_path / 'out.csv').exists()
+
+
+def test_reload_rebuilds_the_reverse_index():
+    from src.reverse import reverse_index
+    server = Server('/tmp/timezone-test.sock')
+    before = reverse_index()
+    server.reload()
+    assert reverse_index() is not before
+
+
+def test_reload_rebuilds_the_exact_index():
+    from src.exact import exact_index
+    server = Server('/tmp/timezone-test.sock')
+    before = exact_index()
+    server.reload()
+    assert exact_index() is not before
+    assert exact_index().lookup('Asia/Tokyo') is not None
@@ -0,0 +1,30 @@
+import io
+from collections import Counter
+
+import numpy as np
+
+from src.stream import convert_stream, parse_timestamps
+
+
+def test_unparseable_values_become_nat():
+    timestamps, aware = parse_timestamps(['2026-07-01T10:00', 'not-a-date', '2026-07-01T10:00Z', ''])
+    assert np.isnat(timestamps).tolist() == [False, True, False, True]
+    assert aware.tolist() == [False, False, True, False]
+
+
+def test_stream_keeps_going_past_bad_rows():
+    source = io.StringIO('id,ts\n1,not-a-date\n2,2026-07-01T12:00\n3,2026-13-45T00:00\n4,2026-01-01T00:00Z\n')
+    sink   = io.StringIO()
+    assert convert_stream(source, sink, ['ts'], 'UTC', to_zone='Asia/Tokyo', chunk_size=2) == 4
+    assert sink.getvalue().splitlines() == ['id,ts', '1,', '2,2026-07-01T21:00:00', '3,', '4,2026-01-01T09:00:00']
+
+
+def test_rows_with_unknown_zones_are_written_empty_and_counted():
+    source  = io.StringIO('id,ts,zone\n1,2026-07-01T12:00,Asia/Tokyo\n2,2026-07-01T12:00,Mars/Base\n'
+                          '3,2026-07-01T12:00,\n4,2026-07-01T12:00,Europe/Paris\n5,2026-07-01T12:00,Mars/Base\n')
+    sink    = io.StringIO()
+    unknown = Counter()
+    assert convert_stream(source, sink, ['ts'], 'UTC', to_column='zone', chunk_size=2, unknown=unknown) == 5
+    assert [line.split(',')[1] for line in sink.getvalue().splitlines()[1:]] == \
+        ['2026-07-01T21:00:00', '', '', '2026-07-01T14:00:00', '']
+    assert unknown == {'Mars/Base': 2, '': 1}
@@ -0,0 +1,17 @@
+from src.transitions import TransitionStore
+
+
+def test_store_stays_bounded_when_a_table_grows():
+    store  = TransitionStore(max_bytes=20000)
+    tables = [store.get(name) for name in ('Asia/Tokyo', 'America/New_York', 'Europe/Paris', 'Europe/Berlin')]
+    assert store.nbytes <= store.max_bytes
+    tables[-1].extend(3000)
+    assert store.nbytes <= store.max_bytes or len(store) == 1
+    # the table that grew is the most recently used one and stays
+    assert store.get('Europe/Berlin') is tables[-1]
+
+
+def test_links_share_their_target_table():
+    store = TransitionStore()
+    assert store.get('Europe/Busingen') is store.get('Europe/Zurich')
+    assert len(store) == 1